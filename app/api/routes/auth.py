@@ -5,20 +5,23 @@ from sqlalchemy.orm import Session
 
 from app.core.auth import (
     verify_token,
-    create_token,
+    create_access_token,
     decode_token,
     create_refresh_token,
     set_refresh_token,
     clear_refresh_token,
 )
+from app.core.deps import LEGACY_TOKEN_VERSION, invalidate_employee
 from app.core.security import verify_password, hash_password
 from app.db.init_db import get_db
+from app.db.loaders import loader_profile
 from app.models import Employee, JobPosition
 from app.models.core.job_position import PositionEnum, JobType
 from app.rate_limiter import limiter
 from limits.strategies import FixedWindowRateLimiter
 from app.schemas.login import LoginPayload, AuthResponse
 from app.schemas.employee import EmployeeOut, EmployeePut
+from app.services.job_stats import create_job_stats
 
 router = APIRouter()
 
@@ -40,11 +43,18 @@ def refresh_token(request: Request, response: Response, db=Depends(get_db)):
     except JWTError:
         raise HTTPException(status_code=403, detail="Invalid or expired refresh token")
 
-    employee = db.query(Employee).filter_by(public_id=user_id).first()
+    employee = (
+        db.query(Employee)
+        .options(*loader_profile("auth.refresh"))
+        .filter_by(public_id=user_id)
+        .first()
+    )
     if not employee:
         raise HTTPException(status_code=404, detail="User not found")
+    if payload.get("tv", LEGACY_TOKEN_VERSION) != employee.token_version:
+        raise HTTPException(status_code=401, detail="Refresh token has been revoked")
 
-    access_token = create_token(employee.public_id)
+    access_token = create_access_token(employee)
     return {"access_token": access_token}
 
 
@@ -61,7 +71,12 @@ def get_me(payload: dict = Depends(verify_token), db: Session = Depends(get_db))
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid token subject")
 
-    employee = db.query(Employee).filter_by(public_id=employee_id).first()
+    employee = (
+        db.query(Employee)
+        .options(*loader_profile("auth.me"))
+        .filter_by(public_id=employee_id)
+        .first()
+    )
     if not employee:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -76,7 +91,12 @@ def login(
     data: LoginPayload,
     db: Session = Depends(get_db),
 ):
-    employee = db.query(Employee).filter_by(username=data.username).first()
+    employee = (
+        db.query(Employee)
+        .options(*loader_profile("auth.login"))
+        .filter_by(username=data.username)
+        .first()
+    )
 
     if not employee:
         raise HTTPException(status_code=404, detail="User not found")
@@ -84,8 +104,8 @@ def login(
     if not verify_password(data.password, employee.password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    access_token = create_token(employee.public_id)
-    refresh_token = create_refresh_token(employee.public_id)
+    access_token = create_access_token(employee)
+    refresh_token = create_refresh_token(employee.public_id, employee.token_version)
     set_refresh_token(response, refresh_token)
 
     return AuthResponse(
@@ -136,13 +156,21 @@ def signup(
         )
         db.add(new_job)
         db.flush()
+        create_job_stats(db, new_job.id)
         employee.job_position_id = new_job.id
 
     db.commit()
-    db.refresh(employee)
+    invalidate_employee(employee.public_id)
+    employee = (
+        db.query(Employee)
+        .options(*loader_profile("auth.signup"))
+        .populate_existing()
+        .filter_by(id=employee.id)
+        .one()
+    )
 
-    access_token = create_token(employee.public_id)
-    refresh_token = create_refresh_token(employee.public_id)
+    access_token = create_access_token(employee)
+    refresh_token = create_refresh_token(employee.public_id, employee.token_version)
     if response:
         set_refresh_token(response, refresh_token)
 
@@ -0,0 +1,50 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.deps import invalidate_employee, revoke_employee_tokens
+from app.db.init_db import get_db
+from app.db.pool import pool_status
+from app.db.replica import replica_engines
+from app.db.session import engine, async_engine
+from app.models import Employee
+
+router = APIRouter()
+
+
+def require_internal_token(token: Optional[str]) -> None:
+    if not settings.INTERNAL_API_TOKEN or token != settings.INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=404, detail="Not found")
+
+
+@router.get("/db-pool")
+def get_db_pool_status(internal_token: Optional[str] = Header(None, alias="X-Internal-Token")):
+    require_internal_token(internal_token)
+
+    return {
+        "primary": pool_status(engine),
+        "primary_async": pool_status(async_engine.sync_engine),
+        "replicas": [pool_status(replica.sync_engine) for replica in replica_engines],
+    }
+
+
+@router.post("/employees/{employee_public_id}/revoke-tokens")
+def revoke_tokens(
+        employee_public_id: UUID,
+        internal_token: Optional[str] = Header(None, alias="X-Internal-Token"),
+        db: Session = Depends(get_db),
+):
+    require_internal_token(internal_token)
+
+    employee_id = db.query(Employee.id).filter_by(public_id=employee_public_id).scalar()
+    if employee_id is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+
+    revoke_employee_tokens(db, employee_id)
+    db.commit()
+    invalidate_employee(employee_public_id)
+
+    return {"detail": "Tokens revoked"}
@@ -1,14 +1,24 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import asc, desc, func
-from sqlalchemy.orm import Session, joinedload
-
-from app.core.auth import verify_token
-from app.db.init_db import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.deps import CurrentEmployee, current_employee
+from app.core.etag import etag_headers, listing_etag, not_modified
+from app.db.init_db import get_db, get_read_db
+from app.db.loaders import loader_profile
+from app.db.pagination import (
+    decode_cursor,
+    keyset_order,
+    keyset_predicate,
+    next_cursor,
+    page_total,
+    with_window_total,
+)
 from app.models import (
     JobPosition,
-    Employee,
     JobApplication,
     Competency,
     JobInterview,
@@ -16,6 +26,9 @@ from app.models import (
 )
 from app.schemas.job_interview import PaginatedInterviewResponse, InterviewOut
 from app.schemas.success_response import SuccessResponse
+from app.services.interviewer_stats import refresh_interviewer_stats
+from app.services.job_stats import record_interviews
+from app.services.search import JOB_TITLE_SEARCH_COLUMNS, trigram_filter
 
 router = APIRouter()
 
@@ -37,40 +50,50 @@ DEFAULT_ORDER_DIR = "desc"
 @router.delete("/{interview_public_id}")
 def delete_job(
         interview_public_id: str,
-        payload: dict = Depends(verify_token),
+        employee: CurrentEmployee = Depends(current_employee),
         db: Session = Depends(get_db)
 ):
-    employee_id = payload["sub"]
-    employee = db.query(Employee).filter_by(public_id=employee_id).first()
-
     job = db.query(JobInterview).filter_by(public_id=interview_public_id).first()
 
     if not job:
         raise HTTPException(status_code=404, detail=f"Job {interview_public_id} not found")
 
-    if not employee or employee.company_id != job.company_id:
+    job_position = (
+        db.query(JobPosition.id, JobPosition.company_id)
+        .join(JobApplication, JobApplication.job_position_id == JobPosition.id)
+        .filter(JobApplication.id == job.application_id)
+        .first()
+    )
+    if not job_position or employee.company_id != job_position.company_id:
         raise HTTPException(status_code=403, detail="Unauthorized access to company data")
 
+    record_interviews(db, job_position.id, {job.interview_status: -1})
     db.delete(job)
+    db.flush()
+    refresh_interviewer_stats(db, {job.interviewer_id})
     db.commit()
 
     return SuccessResponse(success=True, message=f"Job {interview_public_id} deleted")
 
 
 @router.get("/interviews", response_model=PaginatedInterviewResponse)
-def get_interviews(
-    payload: dict = Depends(verify_token),
+async def get_interviews(
+    request: Request,
+    response: Response,
+    employee: CurrentEmployee = Depends(current_employee),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1),
     search: Optional[str] = Query(None),
     order_by: str = Query("interview_datetime"),
     order: str = Query("desc"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    # Validate auth
-    employee = db.query(Employee).filter_by(public_id=payload["sub"]).first()
-    if not employee:
-        raise HTTPException(status_code=403, detail="Unauthorized access to company data")
+    # Unchanged since the client's copy: answer before touching the database
+    etag = await listing_etag(request, employee)
+    if cached := not_modified(request, etag):
+        return cached
 
     # Validate sorting inputs
     if order_by not in ALLOWED_INTERVIEW_ORDER_FIELDS:
@@ -80,23 +103,23 @@ def get_interviews(
 
     # Build base query
     query = (
-        db.query(JobInterview)
+        select(JobInterview)
+        .join(JobInterview.application)
+        .join(JobApplication.candidate)
+        .join(JobApplication.job_position)
+        .join(JobInterview.competency)
         .filter(
             JobInterview.interviewer_id == employee.id,
-            JobInterview.interview_status.notin_(EXCLUDED_STATUSES)
-        )
-        .options(
-            joinedload(JobInterview.application)
-            .joinedload(JobApplication.candidate),
-            joinedload(JobInterview.application)
-            .joinedload(JobApplication.job_position),
-            joinedload(JobInterview.competency),
+            JobInterview.interview_status.notin_(EXCLUDED_STATUSES),
+            JobPosition.is_deleted.is_(False),
+            Candidate.is_deleted.is_(False),
         )
+        .options(*loader_profile("interviewer.interviews"))
     )
 
     # Apply search filter on job title
     if search:
-        query = query.filter(JobPosition.title.ilike(f"%{search.lower()}%"))
+        query = query.filter(trigram_filter(JOB_TITLE_SEARCH_COLUMNS, search))
 
     # Map order_by to actual columns
     order_field_map = {
@@ -107,11 +130,30 @@ def get_interviews(
     }
 
     order_column = order_field_map[order_by]
-    query = query.order_by(asc(order_column) if order == "asc" else desc(order_column))
+    order_key = f"{order_by}:{order}"
 
     # Pagination
-    total = query.count()
-    results = query.offset((page - 1) * limit).limit(limit).all()
+    count_query = query
+    query = (
+        query.add_columns(order_column.label("sort_key"))
+        .order_by(*keyset_order(order_column, JobInterview.id, order))
+    )
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, order_key)
+        query = query.filter(keyset_predicate(order_column, JobInterview.id, order, sort_value, row_id))
+    else:
+        query = query.offset((page - 1) * limit)
+        if include_total:
+            query = with_window_total(query)
+
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    cursor_out = next_cursor(order_key, rows, limit, lambda r: (r.sort_key, r[0].id))
+    results = [interview for interview, *_ in rows[:limit]]
+
+    total = None
+    if include_total:
+        scope_key = f"interviews:{employee.id}:{search}"
+        total = await page_total(db, count_query, rows, scope_key, windowed=not cursor)
 
     # Format results
     interviews = [
@@ -126,9 +168,11 @@ def get_interviews(
         for interview in results
     ]
 
+    response.headers.update(etag_headers(etag))
     return PaginatedInterviewResponse(
         interviews=interviews,
         total=total,
         page=page,
         limit=limit,
+        next_cursor=cursor_out,
     )
\ No newline at end of file
@@ -1,38 +1,100 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Form, Path
-from sqlalchemy import asc, desc, func, distinct, literal
-from sqlalchemy.orm import Session, joinedload
-
-from app.core.auth import verify_token
-from app.db.init_db import get_db
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Form, Path, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.cache import invalidate_on_commit, job_tag
+from app.core.deps import CurrentEmployee, current_employee
+from app.core.etag import etag_headers, listing_etag, not_modified
+from app.db.init_db import get_db, get_read_db
+from app.db.loaders import loader_profile
+from app.db.pagination import (
+    decode_cursor,
+    keyset_order,
+    keyset_predicate,
+    next_cursor,
+    page_total,
+    with_window_total,
+)
 from app.models import (
     JobPosition,
-    Company,
     Employee,
     JobApplication,
     Competency,
     JobInterview,
-    Candidate, PhoneNumber, InterviewStatusEnum,
+    JobPositionStats,
+    InterviewerStats,
+    Candidate, PhoneNumber, InterviewStatusEnum, JobApplicationStatus,
 )
 from app.models.core import RoleEnum
 from app.models.core.job_position import PositionEnum, JobType
-from app.schemas.candidate import CandidateMinimal, CandidateOut
+from app.schemas.candidate import (
+    CandidateMinimal,
+    CandidateOut,
+    CandidateApplicationMinimal,
+    CandidateImportReport,
+    CandidateSearchHit,
+    PaginatedCandidateSearchResponse,
+)
 from app.schemas.competency import CompetencyMinimal
+from app.schemas.dashboard import RecruiterDashboardResponse
 from app.schemas.job import PaginatedJobResponse, JobOut, JobMinimal
 from app.schemas.job_application import PaginatedApplicationResponse, ApplicationOut
-from app.schemas.job_interview import InterviewWithMeta, InterviewOut
+from app.schemas.job_interview import (
+    InterviewWithMeta,
+    InterviewOut,
+    InterviewScheduleRequest,
+    InterviewScheduleResponse,
+    InterviewAutoAssignRequest,
+    InterviewAutoAssignResponse,
+    InterviewAssignmentOut,
+)
 from app.schemas.phone_number import PhoneNumberOut
 from app.schemas.success_response import SuccessResponse
 from app.schemas.employee import PaginatedEmployeeResponse, EmployeeInterviewerOut, EmployeeOut
+from app.services.candidate_import import (
+    CSV_CONTENT_TYPES,
+    NDJSON_CONTENT_TYPES,
+    CandidateImporter,
+    iter_lines,
+    iter_records,
+)
+from app.services.dashboard import dashboard_bytes
+from app.services.interview_scheduling import schedule_interviews
+from app.services.interviewer_assignment import apply_assignments, plan_assignments
+from app.services.interviewer_stats import interviewer_ids_for, refresh_interviewer_stats
+from app.services.job_stats import record_applications, record_interview_status_change
+from app.services.purge import (
+    delete_candidate,
+    delete_job_position,
+    needs_background_delete,
+    purge_candidate,
+    purge_job_position,
+    run_purge,
+    soft_delete_candidate,
+    soft_delete_job_position,
+)
+from app.services.search import (
+    CANDIDATE_DOCUMENT,
+    CANDIDATE_SEARCH_COLUMNS,
+    JOB_TITLE_SEARCH_COLUMNS,
+    fulltext_match,
+    fulltext_rank,
+    prefix_tsquery,
+    trigram_filter,
+    trigram_rank,
+)
 
 router = APIRouter()
 
 # Config
-ALLOWED_JOB_ORDER_FIELDS = {"title", "status", "created_at", "job_applications", "competencies"}
-ALLOWED_APP_ORDER_FIELDS = {"name", "created_at", "status"}
+ALLOWED_JOB_ORDER_FIELDS = {"title", "status", "created_at", "job_applications", "competencies", "relevance"}
+ALLOWED_APP_ORDER_FIELDS = {"name", "created_at", "status", "relevance"}
 ALLOWED_ORDER_DIRS = {"asc", "desc"}
 ALLOWED_JOB_STATUSES = {"ACTIVE", "PAUSED", "COMPLETED"}
 DEFAULT_ORDER_BY = "created_at"
@@ -42,29 +104,36 @@ DEFAULT_ORDER_DIR = "desc"
 @router.delete("/{job_id}")
 def delete_job(
         job_id: str,
-        payload: dict = Depends(verify_token),
+        background_tasks: BackgroundTasks,
+        employee: CurrentEmployee = Depends(current_employee),
         db: Session = Depends(get_db)
 ):
-    employee_id = payload["sub"]
-    employee = db.query(Employee).filter_by(public_id=employee_id).first()
-
-    job = db.query(JobPosition).filter_by(public_id=job_id).first()
+    job = db.query(JobPosition).filter_by(public_id=job_id, is_deleted=False).first()
 
     if not job:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-    if not employee or employee.company_id != job.company_id:
+    if employee.company_id != job.company_id:
         raise HTTPException(status_code=403, detail="Unauthorized access to company data")
 
-    db.delete(job)
+    invalidate_on_commit(db, job_tag(job.public_id))
+
+    # Small subtrees go in one cascading DELETE; large ones are hidden now and purged in chunks
+    if needs_background_delete(db, job_position_id=job.id):
+        soft_delete_job_position(db, job.id)
+        background_tasks.add_task(run_purge, purge_job_position, job.id)
+    else:
+        delete_job_position(db, job.id)
     db.commit()
 
     return SuccessResponse(success=True, message=f"Job {job_id} deleted")
 
 
 @router.get("/jobs", response_model=PaginatedJobResponse)
-def get_jobs(
-        payload: dict = Depends(verify_token),
+async def get_jobs(
+        request: Request,
+        response: Response,
+        employee: CurrentEmployee = Depends(current_employee),
         company_public_id: str = Query(..., description="Public ID of the company"),
         page: int = Query(1, ge=1),
         limit: int = Query(10, ge=1),
@@ -72,30 +141,36 @@ def get_jobs(
         search: Optional[str] = Query(None),
         order_by: str = Query("title"),
         order: str = Query("desc"),
-        db: Session = Depends(get_db),
+        cursor: Optional[str] = Query(None),
+        include_total: bool = Query(True),
+        db: AsyncSession = Depends(get_read_db),
 ):
-    # Validate auth and ownership
-    employee = db.query(Employee).filter_by(public_id=payload["sub"]).first()
-    company = db.query(Company).filter_by(public_id=company_public_id).first()
+    # Unchanged since the client's copy: answer before touching the database
+    etag = await listing_etag(request, employee)
+    if cached := not_modified(request, etag):
+        return cached
 
-    if not company:
-        raise HTTPException(status_code=404, detail=f"Company {company_public_id} not found")
-    if not employee or employee.company_id != company.id:
+    # Validate auth and ownership; the caller's company comes with the token
+    if company_public_id.lower() != str(employee.company_public_id):
         raise HTTPException(status_code=403, detail="Unauthorized access to company data")
+    company_id = employee.company_id
 
     # Validate sorting inputs
     if order_by not in ALLOWED_JOB_ORDER_FIELDS:
         raise HTTPException(status_code=400, detail=f"Invalid order_by field: {order_by}")
     if order not in ALLOWED_ORDER_DIRS:
         raise HTTPException(status_code=400, detail=f"Invalid order direction: {order}")
+    if order_by == "relevance" and not search:
+        raise HTTPException(status_code=400, detail="order_by=relevance requires a search term")
 
-    # Count labels
-    job_app_count = func.count(distinct(JobApplication.id)).label("job_applications")
-    competency_count = func.count(distinct(Competency.id)).label("competencies")
+    # Count labels, read from the maintained per-job stats
+    job_app_count = func.coalesce(JobPositionStats.applications_total, 0).label("job_applications")
+    competency_count = func.coalesce(JobPositionStats.competency_count, 0).label("competencies")
 
     # Build query
     query = (
-        db.query(
+        select(
+            JobPosition.id,
             JobPosition.public_id,
             JobPosition.title,
             JobPosition.status,
@@ -104,12 +179,11 @@ def get_jobs(
             job_app_count,
             competency_count,
         )
-        .filter(JobPosition.company_id == company.id,
-                JobPosition.job_type == JobType.EXTERNAL
+        .filter(JobPosition.company_id == company_id,
+                JobPosition.job_type == JobType.EXTERNAL,
+                JobPosition.is_deleted.is_(False),
                 )
-        .outerjoin(JobPosition.job_applications)
-        .outerjoin(JobPosition.competencies)
-        .group_by(JobPosition.id)
+        .outerjoin(JobPositionStats, JobPositionStats.job_position_id == JobPosition.id)
     )
 
     if job_status and job_status != "ALL":
@@ -119,7 +193,7 @@ def get_jobs(
             raise HTTPException(status_code=400, detail=f"Invalid job_status: {job_status}")
 
     if search:
-        query = query.filter(JobPosition.title.ilike(f"%{search.lower()}%"))
+        query = query.filter(trigram_filter(JOB_TITLE_SEARCH_COLUMNS, search))
 
     # Apply ordering
     order_field_map = {
@@ -129,54 +203,76 @@ def get_jobs(
         "job_applications": job_app_count,
         "competencies": competency_count,
     }
+    if order_by == "relevance":
+        order_field_map["relevance"] = trigram_rank(JOB_TITLE_SEARCH_COLUMNS, search).label("relevance")
+        query = query.add_columns(order_field_map["relevance"])
     order_column = order_field_map[order_by]
-    query = query.order_by(asc(order_column) if order == "asc" else desc(order_column))
+    order_key = f"{order_by}:{order}"
 
     # Pagination
-    total = query.count()
-    results = query.offset((page - 1) * limit).limit(limit).all()
+    count_query = query
+    query = query.order_by(*keyset_order(order_column, JobPosition.id, order))
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, order_key)
+        query = query.filter(keyset_predicate(order_column, JobPosition.id, order, sort_value, row_id))
+    else:
+        query = query.offset((page - 1) * limit)
+        if include_total:
+            query = with_window_total(query)
 
+    results = (await db.execute(query.limit(limit + 1))).all()
+
+    total = None
+    if include_total:
+        scope_key = f"jobs:{company_id}:{job_status}:{search}"
+        total = await page_total(db, count_query, results, scope_key, windowed=not cursor)
+
+    response.headers.update(etag_headers(etag))
     return PaginatedJobResponse(
-        jobs=[JobOut.model_validate(i) for i in results],
+        jobs=[JobOut.model_validate(i) for i in results[:limit]],
         total=total,
         page=page,
         limit=limit,
+        next_cursor=next_cursor(order_key, results, limit, lambda r: (getattr(r, order_by), r.id)),
     )
 
 
+@router.get("/dashboard", response_model=RecruiterDashboardResponse)
+async def get_dashboard(
+        employee: CurrentEmployee = Depends(current_employee),
+        db: AsyncSession = Depends(get_read_db),
+):
+    body = await dashboard_bytes(db, employee.company_id)
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/interviewer-meta/{job_interview_public_id}", response_model=InterviewWithMeta)
-def get_candidate_interview(
+async def get_candidate_interview(
         job_interview_public_id: str = Path(...),
-        db: Session = Depends(get_db),
-        payload: dict = Depends(verify_token),
+        db: AsyncSession = Depends(get_read_db),
+        recruiter: CurrentEmployee = Depends(current_employee),
 ):
-    recruiter = db.query(Employee).filter_by(public_id=payload["sub"]).first()
-    if not recruiter:
-        raise HTTPException(status_code=403, detail="Recruiter not found")
-
-    job_interview = db.query(JobInterview).filter_by(public_id=job_interview_public_id).first()
+    job_interview = await db.scalar(select(JobInterview).filter_by(public_id=job_interview_public_id))
     if not job_interview:
         raise HTTPException(status_code=404, detail="Job interview not found")
 
-    interviewer = db.query(Employee).filter_by(id=job_interview.interviewer_id).first()
+    interviewer = await db.get(Employee, job_interview.interviewer_id) if job_interview.interviewer_id else None
     if not interviewer:
         raise HTTPException(status_code=404, detail="Interviewer not found")
 
-    total_interviews = (
-        db.query(JobInterview)
-        .filter_by(interviewer_id=interviewer.id)
-        .count()
-    )
+    total_interviews = await db.scalar(
+        select(InterviewerStats.interviews_total).filter_by(employee_id=interviewer.id)
+    ) or 0
 
-    application = db.query(JobApplication).filter_by(id=job_interview.application_id).first()
+    application = await db.get(JobApplication, job_interview.application_id)
     if not application:
         raise HTTPException(status_code=404, detail="Job application not found")
 
-    candidate = db.query(Candidate).filter_by(id=application.candidate_id).first()
+    candidate = await db.get(Candidate, application.candidate_id)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
-    competency = db.query(Competency).filter_by(id=job_interview.competency_id).first()
+    competency = await db.get(Competency, job_interview.competency_id)
     if not competency:
         raise HTTPException(status_code=404, detail="Competency not found")
 
@@ -198,28 +294,45 @@ def add_interview(
         employee_public_id: str = Query(...),
         date_time: str = Query(...),
         db: Session = Depends(get_db),
-        payload: dict = Depends(verify_token),
+        recruiter: CurrentEmployee = Depends(current_employee),
 ):
-    recruiter = db.query(Employee).filter_by(public_id=payload["sub"]).first()
-    if not recruiter:
-        raise HTTPException(status_code=403, detail="Recruiter not found")
-
-    interviewer = db.query(Employee).filter_by(public_id=employee_public_id).first()
+    interviewer = (
+        db.query(Employee)
+        .filter_by(public_id=employee_public_id, company_id=recruiter.company_id)
+        .first()
+    )
     if not interviewer:
         raise HTTPException(status_code=403, detail="Interviewer not found")
 
-    job_interview = db.query(JobInterview).filter_by(public_id=job_interview_public_id).first()
-    if not job_interview:
+    row = (
+        db.query(JobInterview, JobApplication.job_position_id)
+        .join(JobApplication, JobApplication.id == JobInterview.application_id)
+        .join(JobPosition, JobPosition.id == JobApplication.job_position_id)
+        .filter(
+            JobInterview.public_id == job_interview_public_id,
+            JobPosition.company_id == recruiter.company_id,
+            JobPosition.is_deleted.is_(False),
+        )
+        .first()
+    )
+    if not row:
         raise HTTPException(status_code=404, detail="Job interview not found or unauthorized")
+    job_interview, job_position_id = row
 
     try:
         interview_dt = datetime.fromisoformat(date_time)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid datetime format. Use ISO 8601.")
-    print("here", interview_dt, interviewer.id)
+    record_interview_status_change(
+        db, job_position_id, job_interview.interview_status, InterviewStatusEnum.SCHEDULED
+    )
+
+    previous_interviewer_id = job_interview.interviewer_id
     job_interview.interviewer_id = interviewer.id
     job_interview.interview_datetime = interview_dt
     job_interview.interview_status = InterviewStatusEnum.SCHEDULED
+    db.flush()
+    refresh_interviewer_stats(db, {previous_interviewer_id, interviewer.id})
     db.commit()
 
     return SuccessResponse(
@@ -228,61 +341,127 @@ def add_interview(
     )
 
 
+@router.put("/interviews:schedule", response_model=InterviewScheduleResponse)
+def schedule_interviews_in_bulk(
+        payload: InterviewScheduleRequest,
+        db: Session = Depends(get_db),
+        recruiter: CurrentEmployee = Depends(current_employee),
+):
+    results = schedule_interviews(db, recruiter.company_id, payload.items)
+    db.commit()
+
+    scheduled = sum(result.success for result in results)
+    return InterviewScheduleResponse(
+        scheduled=scheduled,
+        failed=len(results) - scheduled,
+        results=results,
+    )
+
+
+@router.post("/interviews:auto-assign", response_model=InterviewAutoAssignResponse)
+def auto_assign_interviewers(
+        payload: InterviewAutoAssignRequest,
+        db: Session = Depends(get_db),
+        recruiter: CurrentEmployee = Depends(current_employee),
+):
+    job_position_id = None
+    if payload.job_position_public_id:
+        job_position = (
+            db.query(JobPosition)
+            .filter_by(public_id=payload.job_position_public_id, is_deleted=False)
+            .first()
+        )
+        if not job_position or job_position.company_id != recruiter.company_id:
+            raise HTTPException(status_code=404, detail="Job position not found or unauthorized")
+        job_position_id = job_position.id
+
+    plan = plan_assignments(db, recruiter.company_id, job_position_id)
+    if not payload.dry_run:
+        apply_assignments(db, plan)
+        db.commit()
+
+    return InterviewAutoAssignResponse(
+        dry_run=payload.dry_run,
+        assigned=len(plan),
+        assignments=[
+            InterviewAssignmentOut(
+                job_interview_public_id=assignment.interview_public_id,
+                employee_public_id=assignment.interviewer_public_id,
+                cost=assignment.cost,
+            )
+            for assignment in plan
+        ],
+    )
+
+
 @router.get("/get-interviewers", response_model=PaginatedEmployeeResponse)
-def get_interviewers(
+async def get_interviewers(
         job_position_public_id: str = Query(...),
         job_interview_public_id: str = Query(...),
         job_application_public_id: str = Query(...),
 
         page: int = Query(1, ge=1),
         limit: int = Query(10, ge=1),
-        db: Session = Depends(get_db),
-        payload: dict = Depends(verify_token),
+        cursor: Optional[str] = Query(None),
+        include_total: bool = Query(True),
+        db: AsyncSession = Depends(get_read_db),
+        employee: CurrentEmployee = Depends(current_employee),
 ):
 
-    employee = db.query(Employee).filter_by(public_id=payload["sub"]).first()
-    if not employee:
-        raise HTTPException(status_code=403, detail="Recruiter not found")
-
-    job_position = db.query(JobPosition).filter_by(public_id=job_position_public_id).first()
+    job_position = await db.scalar(
+        select(JobPosition).filter_by(public_id=job_position_public_id, is_deleted=False)
+    )
     if not job_position or job_position.company_id != employee.company_id:
         raise HTTPException(status_code=404, detail="Job position not found or unauthorized")
 
-    job_interview = db.query(JobInterview).filter_by(public_id=job_interview_public_id).first()
+    job_interview = await db.scalar(select(JobInterview).filter_by(public_id=job_interview_public_id))
     if not job_interview:
         raise HTTPException(status_code=404, detail="Job interview not found or unauthorized")
 
-    job_application = db.query(JobApplication).filter_by(public_id=job_application_public_id).first()
+    job_application = await db.scalar(select(JobApplication).filter_by(public_id=job_application_public_id))
     if not job_application or job_interview.application_id != job_application.id:
         raise HTTPException(status_code=404, detail="Job interview unauthorized")
 
-    competency = db.query(Competency).filter_by(id=job_interview.competency_id).first()
-    candidate = db.query(Candidate).filter_by(id=job_application.candidate_id).first()
+    competency = await db.get(Competency, job_interview.competency_id)
+    candidate = await db.get(Candidate, job_application.candidate_id)
 
-    interview_stats_subq = (
-        db.query(
-            JobInterview.interviewer_id.label("interviewer_id"),
-            func.count().label("interview_count"),
-            func.max(JobInterview.interview_datetime).label("last_interviewed_at")
-        )
-        .group_by(JobInterview.interviewer_id)
-        .subquery()
+    # Workload comes from the maintained per-interviewer stats rows. next_interview_at is
+    # only as fresh as the last refresh, so times that have already passed are dropped.
+    next_interview_at = case(
+        (InterviewerStats.next_interview_at > datetime.now(timezone.utc), InterviewerStats.next_interview_at)
     )
-
     query = (
-        db.query(
+        select(
             Employee,
-            interview_stats_subq.c.interview_count,
-            interview_stats_subq.c.last_interviewed_at
+            InterviewerStats.interviews_total,
+            InterviewerStats.last_interview_at,
+            next_interview_at,
         )
-        .outerjoin(interview_stats_subq, Employee.id == interview_stats_subq.c.interviewer_id)
+        .outerjoin(InterviewerStats, InterviewerStats.employee_id == Employee.id)
         .filter(
             Employee.company_id == job_position.company_id,
             Employee.role.in_([RoleEnum.interviewer, RoleEnum.recruiter]))
     )
 
-    results = query.offset((page - 1) * limit).limit(limit).all()
-    total = len(results)
+    # Pagination
+    order_key = "id:asc"
+    count_query = query
+    query = query.order_by(*keyset_order(None, Employee.id, "asc"))
+    if cursor:
+        _, row_id = decode_cursor(cursor, order_key)
+        query = query.filter(keyset_predicate(None, Employee.id, "asc", None, row_id))
+    else:
+        query = query.offset((page - 1) * limit)
+        if include_total:
+            query = with_window_total(query)
+
+    results = (await db.execute(query.limit(limit + 1))).all()
+    cursor_out = next_cursor(order_key, results, limit, lambda r: (None, r[0].id))
+
+    total = None
+    if include_total:
+        scope_key = f"interviewers:{job_position.company_id}"
+        total = await page_total(db, count_query, results, scope_key, windowed=not cursor)
 
     candidate_out = CandidateMinimal.model_validate(candidate)
     competency_out = CompetencyMinimal.model_validate(competency)
@@ -295,10 +474,11 @@ def get_interviewers(
             email=emp.email,
             interview_count=count or 0,
             last_interviewed_at=last.isoformat() if last else None,
+            next_interview_at=upcoming.isoformat() if upcoming else None,
             job_position=JobMinimal.model_validate(job_position),
             phone_number=PhoneNumberOut.model_validate(emp.phone_number)
         )
-        for emp, count, last in results
+        for emp, count, last, upcoming, *_ in results[:limit]
     ]
 
     return PaginatedEmployeeResponse(
@@ -307,27 +487,113 @@ def get_interviewers(
         limit=limit,
         candidate=candidate_out,
         competency=competency_out,
-        employees=employee_out
+        employees=employee_out,
+        next_cursor=cursor_out,
+    )
+
+
+@router.get("/candidates/search", response_model=PaginatedCandidateSearchResponse)
+async def search_candidates(
+        q: str = Query(..., min_length=1, max_length=200),
+        limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
+        db: AsyncSession = Depends(get_read_db),
+        employee: CurrentEmployee = Depends(current_employee),
+):
+    tsquery = prefix_tsquery(q)
+    if not tsquery:
+        raise HTTPException(status_code=400, detail="Search term has no searchable words")
+
+    # Candidates are shared rows; scope them to the company through its applications
+    in_company = (
+        select(JobApplication.id)
+        .join(JobPosition, JobPosition.id == JobApplication.job_position_id)
+        .filter(
+            JobApplication.candidate_id == Candidate.id,
+            JobPosition.company_id == employee.company_id,
+            JobPosition.is_deleted.is_(False),
+        )
+        .exists()
+    )
+
+    rank = fulltext_rank(CANDIDATE_DOCUMENT, tsquery)
+    order_key = f"relevance:{tsquery}"
+
+    query = (
+        select(Candidate, rank.label("sort_key"))
+        .filter(fulltext_match(CANDIDATE_DOCUMENT, tsquery), Candidate.is_deleted.is_(False), in_company)
+        .order_by(*keyset_order(rank, Candidate.id, "desc"))
+    )
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, order_key)
+        query = query.filter(keyset_predicate(rank, Candidate.id, "desc", sort_value, row_id))
+
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    candidates = [candidate for candidate, _ in rows[:limit]]
+
+    # Applications of the page's candidates within this company, in one query
+    applications = {candidate.id: [] for candidate in candidates}
+    if candidates:
+        application_rows = await db.execute(
+            select(
+                JobApplication.candidate_id,
+                JobApplication.public_id,
+                JobApplication.status,
+                JobPosition.public_id.label("job_position_public_id"),
+                JobPosition.title.label("job_position_title"),
+            )
+            .join(JobPosition, JobPosition.id == JobApplication.job_position_id)
+            .filter(
+                JobApplication.candidate_id.in_(applications),
+                JobPosition.company_id == employee.company_id,
+                JobPosition.is_deleted.is_(False),
+            )
+            .order_by(JobApplication.created_at.desc())
+        )
+        for row in application_rows:
+            applications[row.candidate_id].append(CandidateApplicationMinimal.model_validate(row))
+
+    return PaginatedCandidateSearchResponse(
+        candidates=[
+            CandidateSearchHit(
+                public_id=candidate.public_id,
+                first_name=candidate.first_name,
+                last_name=candidate.last_name,
+                email=candidate.email,
+                phone_number=PhoneNumberOut.model_validate(candidate.phone_number),
+                applications=applications[candidate.id],
+            )
+            for candidate in candidates
+        ],
+        limit=limit,
+        next_cursor=next_cursor(order_key, rows, limit, lambda r: (r.sort_key, r[0].id)),
     )
 
 
 @router.get("/{job_position_public_id}/applications", response_model=PaginatedApplicationResponse)
-def get_applications_for_job_position(
+async def get_applications_for_job_position(
         job_position_public_id: UUID,
-        db: Session = Depends(get_db),
-        payload: dict = Depends(verify_token),
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_read_db),
+        employee: CurrentEmployee = Depends(current_employee),
         page: int = Query(1, ge=1),
         limit: int = Query(10, ge=1),
         search: Optional[str] = Query(None),
         order_by: str = Query(DEFAULT_ORDER_BY),
         order: str = Query(DEFAULT_ORDER_DIR),
+        cursor: Optional[str] = Query(None),
+        include_total: bool = Query(True),
 ):
-    # Validate
-    employee = db.query(Employee).filter_by(public_id=payload["sub"]).first()
-    if not employee:
-        raise HTTPException(status_code=403, detail="Recruiter not found")
+    # Unchanged since the client's copy: answer before touching the database
+    etag = await listing_etag(request, employee)
+    if cached := not_modified(request, etag):
+        return cached
 
-    job_position = db.query(JobPosition).filter_by(public_id=job_position_public_id).first()
+    # Validate
+    job_position = await db.scalar(
+        select(JobPosition).filter_by(public_id=job_position_public_id, is_deleted=False)
+    )
     if not job_position:
         raise HTTPException(status_code=404, detail="Job position not found")
     if job_position.company_id != employee.company_id:
@@ -337,53 +603,59 @@ def get_applications_for_job_position(
         raise HTTPException(status_code=400, detail=f"Invalid order_by field: {order_by}")
     if order not in ALLOWED_ORDER_DIRS:
         raise HTTPException(status_code=400, detail=f"Invalid order direction: {order}")
+    if order_by == "relevance" and not search:
+        raise HTTPException(status_code=400, detail="order_by=relevance requires a search term")
 
     # Base query
     query = (
-        db.query(JobApplication)
-        .filter(JobApplication.job_position_id == job_position.id)
+        select(JobApplication)
         .join(JobApplication.candidate)
-        .options(
-            joinedload(JobApplication.candidate),
-            joinedload(JobApplication.job_position),
-            joinedload(JobApplication.interviews)
-            .joinedload(JobInterview.competency),
-            joinedload(JobApplication.interviews)
-            .joinedload(JobInterview.application)
-            .joinedload(JobApplication.candidate),
-            joinedload(JobApplication.interviews)
-            .joinedload(JobInterview.application)
-            .joinedload(JobApplication.job_position),
-        )
+        .filter(JobApplication.job_position_id == job_position.id, Candidate.is_deleted.is_(False))
+        .options(*loader_profile("recruiter.applications"))
     )
 
     # Search
     if search:
-        full_name = func.lower(func.concat(Candidate.first_name, literal(" "), Candidate.last_name))
-        query = query.filter(
-            full_name.ilike(f"%{search.lower()}%") |
-            func.lower(Candidate.email).ilike(f"%{search.lower()}%")
-        )
+        query = query.filter(trigram_filter(CANDIDATE_SEARCH_COLUMNS, search))
 
     # Ordering
-    if order_by == "name":
-        order_column = func.lower(func.concat(Candidate.first_name, literal(" "), Candidate.last_name))
+    if order_by == "relevance":
+        order_column = trigram_rank(CANDIDATE_SEARCH_COLUMNS, search)
     else:
         order_map = {
+            "name": Candidate.full_name,
             "created_at": JobApplication.created_at,
             "status": JobApplication.status,
         }
         order_column = order_map[order_by]
 
-    query = query.order_by(asc(order_column) if order == "asc" else desc(order_column))
+    order_key = f"{order_by}:{order}"
 
     # Pagination
-    total = query.count()
-    apps = query.offset((page - 1) * limit).limit(limit).all()
+    count_query = query
+    query = (
+        query.add_columns(order_column.label("sort_key"))
+        .order_by(*keyset_order(order_column, JobApplication.id, order))
+    )
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, order_key)
+        query = query.filter(keyset_predicate(order_column, JobApplication.id, order, sort_value, row_id))
+    else:
+        query = query.offset((page - 1) * limit)
+        if include_total:
+            query = with_window_total(query)
+
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    cursor_out = next_cursor(order_key, rows, limit, lambda r: (r.sort_key, r[0].id))
+
+    total = None
+    if include_total:
+        scope_key = f"applications:{job_position.id}:{search}"
+        total = await page_total(db, count_query, rows, scope_key, windowed=not cursor)
 
     applications = []
 
-    for app in apps:
+    for app, *_ in rows[:limit]:
         interviews = []
 
         for i in app.interviews:
@@ -407,12 +679,14 @@ def get_applications_for_job_position(
             "interviews": interviews,
         })
 
+    response.headers.update(etag_headers(etag))
     return PaginatedApplicationResponse(
         applications=applications,
         job_position=JobMinimal.model_validate(job_position),
         total=total,
         page=page,
         limit=limit,
+        next_cursor=cursor_out,
     )
 
 
@@ -420,18 +694,19 @@ def get_applications_for_job_position(
 def create_candidate_for_job_position(
         job_position_public_id: UUID,
         db: Session = Depends(get_db),
-        payload: dict = Depends(verify_token),
+        employee: CurrentEmployee = Depends(current_employee),
         first_name: str = Form(...),
         last_name: str = Form(...),
         email: str = Form(...),
         phone_number_raw: str = Form(...),
         phone_country_code: str = Form(...),
 ):
-    employee = db.query(Employee).filter_by(public_id=payload["sub"]).first()
-    if not employee:
-        raise HTTPException(status_code=403, detail="Recruiter not found")
-
-    job_position = db.query(JobPosition).filter_by(public_id=job_position_public_id).first()
+    job_position = (
+        db.query(JobPosition)
+        .options(*loader_profile("recruiter.new_candidate"))
+        .filter_by(public_id=job_position_public_id, is_deleted=False)
+        .first()
+    )
     if not job_position:
         raise HTTPException(status_code=404, detail="Job position not found")
 
@@ -469,26 +744,98 @@ def create_candidate_for_job_position(
         )
         db.add(interview)
 
+    record_applications(
+        db, job_position.id, JobApplicationStatus.PENDING, 1,
+        interview_deltas={InterviewStatusEnum.NOT_SCHEDULED: len(competencies)},
+    )
     db.commit()
 
     return SuccessResponse(success=True, message=f"Candidate created: {candidate.public_id}")
 
 
+@router.post("/{job_position_public_id}/candidates:import", response_model=CandidateImportReport)
+async def import_candidates_for_job_position(
+        job_position_public_id: UUID,
+        request: Request,
+        db: Session = Depends(get_db),
+        employee: CurrentEmployee = Depends(current_employee),
+):
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type not in CSV_CONTENT_TYPES | NDJSON_CONTENT_TYPES:
+        raise HTTPException(status_code=415, detail="Send text/csv or application/x-ndjson")
+
+    job_position = await run_in_threadpool(
+        lambda: db.query(JobPosition)
+        .options(*loader_profile("recruiter.new_candidate"))
+        .filter_by(public_id=job_position_public_id, is_deleted=False)
+        .first()
+    )
+    if not job_position:
+        raise HTTPException(status_code=404, detail="Job position not found")
+    if job_position.company_id != employee.company_id:
+        raise HTTPException(status_code=403, detail="Unauthorized access")
+
+    # Rows are validated as the body streams in; each full batch is written off the event loop
+    importer = CandidateImporter(db, job_position.id, [c.id for c in job_position.competencies])
+    try:
+        async for row, record, error in iter_records(iter_lines(request.stream()), content_type):
+            importer.add(row, record, error)
+            if importer.full:
+                await run_in_threadpool(importer.flush)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    await run_in_threadpool(importer.flush)
+
+    return importer.report()
+
+
+@router.delete("/candidates/{candidate_public_id}", response_model=SuccessResponse)
+def delete_candidate_record(
+        candidate_public_id: UUID,
+        background_tasks: BackgroundTasks,
+        employee: CurrentEmployee = Depends(current_employee),
+        db: Session = Depends(get_db)
+):
+    candidate = db.query(Candidate).filter_by(public_id=candidate_public_id, is_deleted=False).first()
+    if not candidate:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+
+    company_ids = set(db.scalars(
+        select(JobPosition.company_id)
+        .join(JobApplication, JobApplication.job_position_id == JobPosition.id)
+        .where(JobApplication.candidate_id == candidate.id)
+    ))
+    if employee.company_id not in company_ids:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    if company_ids != {employee.company_id}:
+        raise HTTPException(
+            status_code=409,
+            detail="Candidate has applications with other companies; remove them from your jobs instead",
+        )
+
+    if needs_background_delete(db, candidate_id=candidate.id):
+        soft_delete_candidate(db, candidate.id)
+        background_tasks.add_task(run_purge, purge_candidate, candidate.id)
+    else:
+        delete_candidate(db, candidate.id)
+    db.commit()
+
+    return SuccessResponse(success=True, message=f"Candidate {candidate_public_id} deleted")
+
+
 @router.delete("/{job_position_public_id}/{candidate_public_id}", response_model=SuccessResponse)
 def delete_candidate_from_job(
         job_position_public_id: str,
         candidate_public_id: str,
-        payload: dict = Depends(verify_token),
+        employee: CurrentEmployee = Depends(current_employee),
         db: Session = Depends(get_db)
 ):
-    employee_id = payload["sub"]
-    employee = db.query(Employee).filter_by(public_id=employee_id).first()
-
-    if not employee:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
-    candidate = db.query(Candidate).filter_by(public_id=candidate_public_id).first()
-    job_position = db.query(JobPosition).filter_by(public_id=job_position_public_id).first()
+    candidate = db.query(Candidate).filter_by(public_id=candidate_public_id, is_deleted=False).first()
+    job_position = (
+        db.query(JobPosition)
+        .filter_by(public_id=job_position_public_id, company_id=employee.company_id, is_deleted=False)
+        .first()
+    )
 
     if not candidate or not job_position:
         raise HTTPException(status_code=404, detail="Candidate or job not found")
@@ -505,9 +852,23 @@ def delete_candidate_from_job(
             detail="Job application not found for this candidate and job",
         )
 
+    interview_counts = (
+        db.query(JobInterview.interview_status, func.count())
+        .filter_by(application_id=application.id)
+        .group_by(JobInterview.interview_status)
+        .all()
+    )
+    record_applications(
+        db, job_position.id, application.status, -1,
+        interview_deltas={status: -count for status, count in interview_counts},
+    )
+
+    interviewer_ids = interviewer_ids_for(db, JobInterview.application_id == application.id)
     db.query(JobInterview).filter_by(application_id=application.id).delete()
 
     db.delete(application)
+    db.flush()
+    refresh_interviewer_stats(db, interviewer_ids)
     db.commit()
 
     return SuccessResponse(success=True, message="Candidate removed from job")
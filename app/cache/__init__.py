@@ -0,0 +1,19 @@
+from .invalidation import (
+    company_tag,
+    invalidate_on_commit,
+    invalidate_tags,
+    job_tag,
+    start_invalidation_listener,
+    stop_invalidation_listener,
+)
+from .tiered import TwoTierCache
+
+__all__ = [
+    "TwoTierCache",
+    "company_tag",
+    "job_tag",
+    "invalidate_on_commit",
+    "invalidate_tags",
+    "start_invalidation_listener",
+    "stop_invalidation_listener",
+]
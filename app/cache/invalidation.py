@@ -0,0 +1,107 @@
+import asyncio
+import json
+from collections import defaultdict
+from typing import Iterable, Optional
+
+import redis.asyncio as aioredis
+from redis import RedisError
+
+from app.core.config import settings
+from app.core.redis import redis_client
+
+CHANNEL = "cache:invalidate"
+TAG_VERSION_KEY = "cache:tag:{}"
+
+
+def company_tag(company_id: int) -> str:
+    return f"company:{company_id}"
+
+
+def job_tag(job_public_id) -> str:
+    return f"job:{job_public_id}"
+
+
+# ─── Local generations ─────────────────────────────────────
+# L1 entries remember the generations of their tags when they were built and
+# are stale once any of them moves. Bumping the epoch invalidates everything.
+_generations: dict[str, int] = defaultdict(int)
+_epoch = 0
+
+
+def local_generations(tags: Iterable[str]) -> tuple:
+    return (_epoch, *(_generations[tag] for tag in tags))
+
+
+def _drop_local(tags: Iterable[str]) -> None:
+    for tag in tags:
+        _generations[tag] += 1
+
+
+def _drop_all_local() -> None:
+    global _epoch
+    _epoch += 1
+
+
+# ─── Invalidation ──────────────────────────────────────────
+def invalidate_tags(*tags: str) -> None:
+    """Makes every entry carrying one of `tags` stale, in Redis and in all workers' L1."""
+    if not tags:
+        return
+    _drop_local(tags)
+    try:
+        with redis_client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(TAG_VERSION_KEY.format(tag))
+            pipe.publish(CHANNEL, json.dumps(tags))
+            pipe.execute()
+    except RedisError:
+        pass
+
+
+def invalidate_on_commit(session, *tags: str) -> None:
+    """
+    Queues `tags` to be invalidated once `session` commits; a rollback discards
+    them (see app.db.hooks). Writes also invalidate the session's company tag.
+    """
+    session.info.setdefault("cache_tags", set()).update(tags)
+
+
+# ─── Cross-worker fan-out ──────────────────────────────────
+_listener: Optional[asyncio.Task] = None
+
+
+async def _listen() -> None:
+    # Dedicated connection: the shared client's short socket timeout would cut idle subscriptions
+    client = aioredis.Redis.from_url(settings.REDIS_URL)
+    while True:
+        try:
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(CHANNEL)
+                # Messages published while we were not subscribed are lost
+                _drop_all_local()
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        _drop_local(json.loads(message["data"]))
+        except asyncio.CancelledError:
+            await client.close()
+            raise
+        except (RedisError, OSError, ValueError):
+            await asyncio.sleep(settings.CACHE_RESUBSCRIBE_SECONDS)
+
+
+def start_invalidation_listener() -> None:
+    global _listener
+    if _listener is None:
+        _listener = asyncio.get_running_loop().create_task(_listen())
+
+
+async def stop_invalidation_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.cancel()
+        try:
+            await _listener
+        except asyncio.CancelledError:
+            pass
+        _listener = None
@@ -0,0 +1,68 @@
+from typing import Awaitable, Callable, Iterable, Optional
+
+from redis import RedisError
+
+from app.core.redis import async_redis_client
+from app.core.ttl_cache import TTLCache
+from app.cache.invalidation import TAG_VERSION_KEY, local_generations
+
+CACHE_KEY = "cache:{}:{}"
+
+
+def _stamp(versions: list) -> bytes:
+    return b",".join(version or b"0" for version in versions)
+
+
+class TwoTierCache:
+    """
+    Encoded values cached in a process-local LRU (L1) in front of Redis (L2).
+
+    Entries carry tags. L1 entries are checked against the worker's tag
+    generations, which `invalidate_tags` and the pub/sub listener advance; L2
+    entries are stamped with the Redis tag versions they were built under, so
+    a value built while one of its tags was being invalidated is never served.
+    """
+
+    def __init__(self, namespace: str, maxsize: int, ttl: int, local_ttl: Optional[int] = None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._local = TTLCache(maxsize=maxsize, ttl=local_ttl or ttl)
+
+    async def get_or_set(
+            self,
+            key: str,
+            build: Callable[[], Awaitable[bytes]],
+            tags: Iterable[str] = (),
+    ) -> bytes:
+        tags = sorted(tags)
+        generations = local_generations(tags)
+        entry = self._local.get(key)
+        if entry is not None and entry[0] == generations:
+            return entry[1]
+
+        redis_key = CACHE_KEY.format(self.namespace, key)
+        stamp = None
+        try:
+            stored, *versions = await async_redis_client.mget(
+                redis_key, *(TAG_VERSION_KEY.format(tag) for tag in tags)
+            )
+            stamp = _stamp(versions)
+            if stored is not None:
+                stored_stamp, _, value = stored.partition(b"\n")
+                if stored_stamp == stamp:
+                    self._local.set(key, (generations, value))
+                    return value
+        except RedisError:
+            pass
+
+        value = await build()
+        self._local.set(key, (generations, value))
+        if stamp is not None:
+            try:
+                await async_redis_client.set(redis_key, stamp + b"\n" + value, ex=self.ttl)
+            except RedisError:
+                pass
+        return value
+
+    def clear_local(self) -> None:
+        self._local.clear()
@@ -1,6 +1,8 @@
+import hashlib
 import os
+import time
 from uuid import UUID
-from typing import Any
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
@@ -9,6 +11,9 @@ from fastapi import Depends, HTTPException, status, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
 
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+
 load_dotenv()
 
 security = HTTPBearer()
@@ -17,6 +22,11 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# SHA-256 of a verified token -> its claims, each entry expiring with the token's `exp`
+_verified_tokens = TTLCache(
+    maxsize=settings.VERIFIED_TOKEN_CACHE_SIZE, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
 
 # ─── Token Creation ────────────────────────────────────────
 def create_token(
@@ -47,39 +57,99 @@ def create_onboarding_token(email: str) -> str:
     )
 
 
-def create_refresh_token(sub: str | UUID) -> str:
+def create_access_token(employee) -> str:
+    """
+    Access token for an Employee (with its company loaded). The claims carry
+    everything current_employee needs, so most requests authorize without
+    reading the employee row.
+    """
+    return create_token(
+        sub=employee.public_id,
+        extra={
+            "eid": employee.id,
+            "role": employee.role.value,
+            "cid": employee.company_id,
+            "cpid": str(employee.company.public_id),
+            "tv": employee.token_version,
+        },
+    )
+
+
+def create_refresh_token(sub: str | UUID, token_version: int) -> str:
     return create_token(
         sub=sub,
         expires_in_minutes=60 * 24 * REFRESH_TOKEN_EXPIRE_DAYS,
-        extra={"purpose": "refresh"}
+        extra={"purpose": "refresh", "tv": token_version}
     )
 
 
 # ─── Token Decoding / Verification ─────────────────────────
 def decode_token(token: str) -> dict:
+    digest = hashlib.sha256(token.encode()).digest()
+    claims = _verified_tokens.get(digest)
+    if claims is not None:
+        return claims
+
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
         )
 
+    # Never outlive the token: the entry expires when the signature check would start failing
+    remaining = claims.get("exp", 0) - time.time()
+    if remaining > 0:
+        _verified_tokens.set(digest, claims, ttl=min(remaining, _verified_tokens.ttl))
+    return claims
 
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
-    return decode_token(credentials.credentials)
 
+def _bearer_token(request: Request) -> Optional[str]:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token.strip():
+        return None
+    return token.strip()
 
-def get_user_id(request: Request) -> str:
+
+def request_claims(request: Request) -> Optional[dict]:
+    """
+    Claims of the request's bearer token, or None when it is missing or
+    invalid. Decoded once per request and kept on request.state, which the
+    middlewares, the limiter key function and the dependencies all share.
+    """
     try:
-        auth_header = request.headers.get("Authorization")
-        if not auth_header or not auth_header.startswith("Bearer "):
-            raise ValueError
-        token = auth_header.removeprefix("Bearer ").strip()
-        payload = decode_token(token)
-        return payload.get("sub", "anonymous")
-    except Exception:
-        return "anonymous"
+        return request.state.token_claims
+    except AttributeError:
+        pass
+
+    claims = None
+    token = _bearer_token(request)
+    if token:
+        try:
+            claims = decode_token(token)
+        except HTTPException:
+            pass
+    request.state.token_claims = claims
+    return claims
+
+
+def verify_token(
+        request: Request,
+        credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> dict:
+    claims = request_claims(request)
+    if claims is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+        )
+    return claims
+
+
+def get_user_id(request: Request) -> str:
+    claims = request_claims(request)
+    return claims.get("sub", "anonymous") if claims else "anonymous"
 
 
 # ─── Response Cookie Helpers ───────────────────────────────
@@ -4,7 +4,72 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
+
+
 class Settings:
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL")
+    # Comma-separated read replica URLs; reads fall back to the primary when empty
+    DATABASE_REPLICA_URLS: list[str] = [
+        url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+    ]
+    # Users read from the primary for this long after they commit a write
+    READ_AFTER_WRITE_SECONDS: int = int(os.getenv("READ_AFTER_WRITE_SECONDS", "5"))
+
+    # Process-local cache of verified access tokens (entries expire with the token)
+    VERIFIED_TOKEN_CACHE_SIZE: int = int(os.getenv("VERIFIED_TOKEN_CACHE_SIZE", "10000"))
+
+    # Process-local cache of token subject -> employee, for tokens without authorization claims
+    EMPLOYEE_CACHE_SIZE: int = int(os.getenv("EMPLOYEE_CACHE_SIZE", "10000"))
+    EMPLOYEE_CACHE_TTL_SECONDS: int = int(os.getenv("EMPLOYEE_CACHE_TTL_SECONDS", "60"))
+
+    # How long a worker trusts its cached employee token_version (revocation delay)
+    TOKEN_VERSION_CACHE_TTL_SECONDS: int = int(os.getenv("TOKEN_VERSION_CACHE_TTL_SECONDS", "30"))
+
+    # Totals reused by cursor pages of the same listing scope
+    PAGINATION_TOTAL_CACHE_TTL_SECONDS: int = int(os.getenv("PAGINATION_TOTAL_CACHE_TTL_SECONDS", "30"))
+
+    # Per-company competency name index used when saving jobs
+    COMPETENCY_LIBRARY_CACHE_SIZE: int = int(os.getenv("COMPETENCY_LIBRARY_CACHE_SIZE", "1000"))
+    COMPETENCY_LIBRARY_TTL_SECONDS: int = int(os.getenv("COMPETENCY_LIBRARY_TTL_SECONDS", "300"))
+
+    # Seconds between attempts to resubscribe to cache invalidations after a Redis error
+    CACHE_RESUBSCRIBE_SECONDS: float = float(os.getenv("CACHE_RESUBSCRIBE_SECONDS", "1"))
+
+    # Encoded GET /api/job/{id} payloads, per process and in Redis, keyed by content version
+    JOB_DETAIL_CACHE_SIZE: int = int(os.getenv("JOB_DETAIL_CACHE_SIZE", "500"))
+    JOB_DETAIL_CACHE_TTL_SECONDS: int = int(os.getenv("JOB_DETAIL_CACHE_TTL_SECONDS", "3600"))
+
+    # Per-company recruiter dashboard, dropped early by any write to the company
+    DASHBOARD_CACHE_SIZE: int = int(os.getenv("DASHBOARD_CACHE_SIZE", "1000"))
+    DASHBOARD_CACHE_TTL_SECONDS: int = int(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "30"))
+    DASHBOARD_LIST_LIMIT: int = int(os.getenv("DASHBOARD_LIST_LIMIT", "10"))
+
+    # Rows written per transaction by the bulk candidate import
+    CANDIDATE_IMPORT_BATCH_SIZE: int = int(os.getenv("CANDIDATE_IMPORT_BATCH_SIZE", "1000"))
+
+    # Deletes touching more applications than this run in the background, in chunks
+    BACKGROUND_DELETE_THRESHOLD: int = int(os.getenv("BACKGROUND_DELETE_THRESHOLD", "200"))
+    DELETE_CHUNK_SIZE: int = int(os.getenv("DELETE_CHUNK_SIZE", "1000"))
+
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379")
+
+    # Stored responses for Idempotency-Key retries, and how long an in-flight key stays locked
+    IDEMPOTENCY_TTL_SECONDS: int = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+    IDEMPOTENCY_LOCK_SECONDS: int = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "300"))
+
+    # Connection pool (sized per uvicorn worker)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = _env_bool("DB_POOL_PRE_PING", "true")
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+    DB_APPLICATION_NAME: str = os.getenv("DB_APPLICATION_NAME", "scouter-api")
+
+    # Internal endpoints are disabled unless a token is configured
+    INTERNAL_API_TOKEN: str = os.getenv("INTERNAL_API_TOKEN")
 
 settings = Settings()
@@ -1,25 +1,153 @@
+from dataclasses import dataclass
+from uuid import UUID
+
 from fastapi import Depends, HTTPException, status
-from typing import Callable, List
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from typing import Callable, List, Optional
+
 from app.core.auth import verify_token
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+from app.db.hooks import on_commit
+from app.db.init_db import get_db
+from app.models import Company, Employee
+from app.models.core import RoleEnum
 
 
-def require_roles(allowed_roles: List[str]) -> Callable:
-    def guard(payload: dict = Depends(verify_token)) -> dict:
-        roles = payload.get("roles")
+@dataclass(frozen=True)
+class CurrentEmployee:
+    id: int
+    public_id: UUID
+    company_id: int
+    company_public_id: UUID
+    role: RoleEnum
 
-        if not isinstance(roles, list):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Invalid or missing 'roles' in token",
-            )
 
-        if not any(role in roles for role in allowed_roles):
+_employee_cache = TTLCache(
+    maxsize=settings.EMPLOYEE_CACHE_SIZE, ttl=settings.EMPLOYEE_CACHE_TTL_SECONDS
+)
+
+
+# employee id -> current token_version; the only lookup left on the claims path
+_token_versions = TTLCache(
+    maxsize=settings.EMPLOYEE_CACHE_SIZE, ttl=settings.TOKEN_VERSION_CACHE_TTL_SECONDS
+)
+
+TOKEN_CLAIMS = ("sub", "eid", "role", "cid", "cpid", "tv")
+
+# Tokens issued before versioning carry no "tv"; they predate any revocation
+LEGACY_TOKEN_VERSION = 1
+
+
+def invalidate_employee(public_id: str | UUID) -> None:
+    _employee_cache.pop(str(public_id))
+
+
+def token_version(db: Session, employee_id: int) -> Optional[int]:
+    version = _token_versions.get(employee_id)
+    if version is None:
+        version = db.scalar(select(Employee.token_version).where(Employee.id == employee_id))
+        if version is not None:
+            _token_versions.set(employee_id, version)
+    return version
+
+
+def revoke_employee_tokens(db: Session, employee_id: int) -> None:
+    """
+    Invalidates every token issued to the employee so far; the caller commits.
+    This worker drops its cached version once the commit lands, other workers
+    once theirs expires (TOKEN_VERSION_CACHE_TTL_SECONDS).
+    """
+    db.execute(
+        update(Employee)
+        .where(Employee.id == employee_id)
+        .values(token_version=Employee.token_version + 1)
+    )
+    # Popping before the commit would let a concurrent request re-cache the old version
+    on_commit(db, lambda: _token_versions.pop(employee_id))
+
+
+def _check_token_version(db: Session, employee_id: int, payload: dict) -> None:
+    if token_version(db, employee_id) != payload.get("tv", LEGACY_TOKEN_VERSION):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
+
+
+def _employee_from_claims(payload: dict, db: Session) -> CurrentEmployee:
+    _check_token_version(db, payload["eid"], payload)
+    try:
+        return CurrentEmployee(
+            id=payload["eid"],
+            public_id=UUID(payload["sub"]),
+            company_id=payload["cid"],
+            company_public_id=UUID(payload["cpid"]),
+            role=RoleEnum(payload["role"]),
+        )
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token claims")
+
+
+def current_employee(
+    payload: dict = Depends(verify_token),
+    db: Session = Depends(get_db),
+) -> CurrentEmployee:
+    # Tokens issued by create_access_token authorize from their claims alone
+    if all(claim in payload for claim in TOKEN_CLAIMS):
+        employee = _employee_from_claims(payload, db)
+        # Commits on this request's session bump the company's change counter
+        db.info["company_id"] = employee.company_id
+        return employee
+
+    subject = payload.get("sub")
+    cached = _employee_cache.get(subject)
+    if cached is not None:
+        _check_token_version(db, cached.id, payload)
+        db.info["company_id"] = cached.company_id
+        return cached
+
+    try:
+        public_id = UUID(subject)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token subject")
+
+    row = (
+        db.query(
+            Employee.id,
+            Employee.public_id,
+            Employee.company_id,
+            Company.public_id.label("company_public_id"),
+            Employee.role,
+            Employee.token_version,
+        )
+        .join(Company, Company.id == Employee.company_id)
+        .filter(Employee.public_id == public_id)
+        .first()
+    )
+    if not row:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Employee not found")
+
+    _token_versions.set(row.id, row.token_version)
+    _check_token_version(db, row.id, payload)
+
+    employee = CurrentEmployee(
+        id=row.id,
+        public_id=row.public_id,
+        company_id=row.company_id,
+        company_public_id=row.company_public_id,
+        role=row.role,
+    )
+    _employee_cache.set(subject, employee)
+    db.info["company_id"] = employee.company_id
+    return employee
+
+
+def require_roles(allowed_roles: List[str]) -> Callable:
+    def guard(employee: CurrentEmployee = Depends(current_employee)) -> CurrentEmployee:
+        if employee.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions"
             )
 
-        return payload  # Pass payload downstream if needed
+        return employee
 
     return guard
-
-
@@ -0,0 +1,39 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+from app.core.deps import CurrentEmployee
+from app.db.changes import company_version
+
+
+async def listing_etag(request: Request, employee: CurrentEmployee) -> Optional[str]:
+    """
+    Weak ETag for a company-scoped listing: the company's change counter plus
+    the caller and the normalized query. None disables conditional handling.
+    """
+    version = await company_version(employee.company_id)
+    if version is None:
+        return None
+
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(f"{version}|{employee.id}|{request.url.path}|{query}".encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(request: Request, etag: Optional[str]) -> Optional[Response]:
+    """A 304 response when the client's If-None-Match already names `etag`."""
+    header = request.headers.get("if-none-match")
+    if not etag or not header:
+        return None
+    candidates = {tag.strip() for tag in header.split(",")}
+    # Weak comparison: W/"x" and "x" name the same representation
+    if "*" in candidates or etag in candidates or etag.removeprefix("W/") in candidates:
+        return Response(status_code=304, headers=etag_headers(etag))
+    return None
+
+
+def etag_headers(etag: Optional[str]) -> dict:
+    if not etag:
+        return {}
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
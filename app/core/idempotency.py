@@ -0,0 +1,222 @@
+import base64
+import hashlib
+import json
+from typing import Iterable, Optional
+
+from redis import RedisError
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.auth import get_user_id
+from app.core.config import settings
+from app.core.redis import async_redis_client
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+IDEMPOTENCY_KEY = "idempotency:{}:{}"
+MAX_KEY_LENGTH = 255
+PENDING = "pending"
+
+
+def _json_response(status: int, detail: str) -> tuple[int, list, bytes]:
+    body = json.dumps({"detail": detail}).encode()
+    headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    return status, headers, body
+
+
+def _multipart_delimiter(content_type: str) -> Optional[bytes]:
+    """The `--boundary` delimiter of a multipart/form-data body, or None for other bodies."""
+    media_type, *params = content_type.split(";")
+    if media_type.strip().lower() != "multipart/form-data":
+        return None
+    for param in params:
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "boundary" and value.strip('"'):
+            return b"--" + value.strip('"').encode("latin-1")
+    return None
+
+
+class _Fingerprint:
+    """
+    SHA-256 over the request line and body, fed chunk by chunk as the body
+    streams in. Multipart boundaries are replaced by a fixed marker first:
+    clients pick a fresh one on every retry, so the raw bytes never repeat.
+    """
+
+    BOUNDARY_MARKER = b"\0boundary\0"
+
+    def __init__(self, scope: Scope, content_type: str = ""):
+        self._hash = hashlib.sha256()
+        self._hash.update(scope["method"].encode())
+        self._hash.update(b"\0" + scope["path"].encode())
+        self._hash.update(b"\0" + scope.get("query_string", b"") + b"\0")
+        self._delimiter = _multipart_delimiter(content_type)
+        # Tail of the previous chunk that may hold the start of a split delimiter
+        self._pending = b""
+        self.body_done = False
+
+    def _update(self, body: bytes, final: bool) -> None:
+        if self._delimiter is None:
+            self._hash.update(body)
+            return
+        data = (self._pending + body).replace(self._delimiter, self.BOUNDARY_MARKER)
+        keep = 0 if final else min(len(self._delimiter) - 1, len(data))
+        self._hash.update(data[:len(data) - keep])
+        self._pending = data[len(data) - keep:]
+
+    def feed(self, message: Message) -> None:
+        if message["type"] == "http.request":
+            self.body_done = not message.get("more_body", False)
+            self._update(message.get("body", b""), final=self.body_done)
+        elif message["type"] == "http.disconnect":
+            self._update(b"", final=True)
+            self.body_done = True
+
+    async def drain(self, receive: Receive) -> str:
+        while not self.body_done:
+            self.feed(await receive())
+        return self._hash.hexdigest()
+
+
+class IdempotencyMiddleware:
+    """
+    Honors an `Idempotency-Key` header on mutating requests. The first request
+    with a key runs normally and its response is stored in Redis; retries with
+    the same key and payload get the stored response back without reaching the
+    route, a different payload is rejected with 422 and a retry racing the
+    original gets 409. Keys are scoped to the authenticated user. Responses
+    with a 5xx status are not stored, so the client can retry them.
+    Form posts such as new-candidate are covered whether the client sends
+    them urlencoded or as multipart/form-data.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            methods: Iterable[str] = ("POST", "PUT", "PATCH"),
+            exclude_prefixes: Iterable[str] = (),
+    ):
+        self.app = app
+        self.methods = frozenset(methods)
+        self.exclude_prefixes = tuple(exclude_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+                scope["type"] != "http"
+                or scope["method"] not in self.methods
+                or scope["path"].startswith(self.exclude_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+        if not key or len(key) > MAX_KEY_LENGTH:
+            await self._send(send, *_json_response(400, "Invalid Idempotency-Key header"))
+            return
+
+        user_key = get_user_id(request)
+        if user_key == "anonymous":
+            # Without a caller to scope the key to, one client could replay another's response
+            await self.app(scope, receive, send)
+            return
+
+        redis_key = IDEMPOTENCY_KEY.format(user_key, key)
+        fingerprint = _Fingerprint(scope, request.headers.get("content-type", ""))
+        try:
+            claimed = await async_redis_client.set(
+                redis_key, PENDING, nx=True, ex=settings.IDEMPOTENCY_LOCK_SECONDS
+            )
+            stored = None if claimed else await async_redis_client.get(redis_key)
+        except RedisError:
+            await self.app(scope, receive, send)
+            return
+
+        if not claimed:
+            await self._replay(send, stored, await fingerprint.drain(receive))
+            return
+
+        await self._run(scope, receive, send, redis_key, fingerprint)
+
+    async def _run(
+            self, scope: Scope, receive: Receive, send: Send, redis_key: str, fingerprint: _Fingerprint
+    ) -> None:
+        status: Optional[int] = None
+        headers: list = []
+        chunks: list[bytes] = []
+        finished = False
+
+        async def hashing_receive() -> Message:
+            message = await receive()
+            fingerprint.feed(message)
+            return message
+
+        async def capturing_send(message: Message) -> None:
+            nonlocal status, headers, finished
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = message.get("headers", [])
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+            # Settle the key as soon as the response is complete, before any background tasks run
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finished = True
+                stored = status < 500 and await self._store(
+                    redis_key, await fingerprint.drain(receive), status, headers, chunks
+                )
+                if not stored:
+                    # A 5xx, or Redis failed to take the record: retries must not hit 409
+                    await self._release(redis_key)
+
+        try:
+            await self.app(scope, hashing_receive, capturing_send)
+        finally:
+            if not finished:
+                await self._release(redis_key)
+
+    @staticmethod
+    async def _store(redis_key: str, fingerprint: str, status: int, headers: list, chunks: list) -> bool:
+        record = {
+            "fingerprint": fingerprint,
+            "status": status,
+            "headers": [[name.decode("latin-1"), value.decode("latin-1")] for name, value in headers],
+            "body": base64.b64encode(b"".join(chunks)).decode(),
+        }
+        try:
+            await async_redis_client.set(
+                redis_key, json.dumps(record), ex=settings.IDEMPOTENCY_TTL_SECONDS
+            )
+        except RedisError:
+            return False
+        return True
+
+    async def _replay(self, send: Send, stored: Optional[bytes], fingerprint: str) -> None:
+        # None: the original failed and released the key between our SET NX and GET
+        if stored is None or stored.decode() == PENDING:
+            await self._send(send, *_json_response(409, "A request with this Idempotency-Key is still in progress"))
+            return
+
+        record = json.loads(stored)
+        if record["fingerprint"] != fingerprint:
+            await self._send(send, *_json_response(422, "Idempotency-Key was already used for a different request"))
+            return
+
+        headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in record["headers"]]
+        headers.append((b"idempotency-replayed", b"true"))
+        await self._send(send, record["status"], headers, base64.b64decode(record["body"]))
+
+    @staticmethod
+    async def _release(redis_key: str) -> None:
+        try:
+            await async_redis_client.delete(redis_key)
+        except RedisError:
+            pass
+
+    @staticmethod
+    async def _send(send: Send, status: int, headers: list, body: bytes) -> None:
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
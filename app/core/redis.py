@@ -0,0 +1,8 @@
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+# Connections are opened lazily, so importing this module never touches Redis.
+redis_client = redis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.5)
+async_redis_client = aioredis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.5)
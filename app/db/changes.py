@@ -0,0 +1,48 @@
+import time
+from typing import Optional
+
+from redis import RedisError
+
+from app.core.config import settings
+from app.core.redis import redis_client, async_redis_client
+
+COMPANY_VERSION_KEY = "changes:company:{}"
+COMPANY_RECENT_KEY = "changes:company:{}:recent"
+
+
+# ─── Per-company change counter ────────────────────────────
+# Bumped after every committed write made on behalf of a company. Counters start
+# from the clock rather than zero so a Redis flush can never reissue an old value.
+def bump_company_version(company_id: Optional[int]) -> None:
+    if company_id is None:
+        return
+    try:
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(COMPANY_VERSION_KEY.format(company_id), time.time_ns(), nx=True)
+            pipe.incr(COMPANY_VERSION_KEY.format(company_id))
+            pipe.set(COMPANY_RECENT_KEY.format(company_id), 1, ex=settings.READ_AFTER_WRITE_SECONDS)
+            pipe.execute()
+    except RedisError:
+        pass
+
+
+async def company_version(company_id: int) -> Optional[str]:
+    """
+    Current change counter of the company, or None when it cannot be trusted to
+    describe what a read will see: Redis is unavailable, or a replica may not
+    have caught up with the latest write yet.
+    """
+    version_key = COMPANY_VERSION_KEY.format(company_id)
+    try:
+        version, recent = await async_redis_client.mget(
+            version_key, COMPANY_RECENT_KEY.format(company_id)
+        )
+        if version is None:
+            await async_redis_client.set(version_key, time.time_ns(), nx=True)
+            version = await async_redis_client.get(version_key)
+    except RedisError:
+        return None
+
+    if recent and settings.DATABASE_REPLICA_URLS:
+        return None
+    return version.decode() if version is not None else None
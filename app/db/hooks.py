@@ -0,0 +1,51 @@
+from typing import Callable
+
+from sqlalchemy import event
+
+from app.cache.invalidation import company_tag, invalidate_tags
+from app.db.changes import bump_company_version
+from app.db.replica import mark_recent_write
+from app.db.session import SessionLocal
+
+
+# ─── Commit hooks ──────────────────────────────────────────
+# The one set of SessionLocal listeners. A session that wrote anything gets,
+# once it commits: read-your-writes stickiness for its caller, a bump of its
+# company's change counter and invalidation of the company's cache tag, plus
+# whatever tags and callbacks were queued on it. A rollback discards it all.
+def on_commit(session, callback: Callable[[], None]) -> None:
+    """Runs `callback()` once `session` commits; a rollback discards it."""
+    session.info.setdefault("on_commit", []).append(callback)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _track_write(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _track_bulk_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _after_commit(session):
+    tags = session.info.pop("cache_tags", set())
+    callbacks = session.info.pop("on_commit", [])
+    if session.info.pop("wrote", False):
+        company_id = session.info.get("company_id")
+        mark_recent_write(session.info.get("sticky_key"))
+        bump_company_version(company_id)
+        if company_id is not None:
+            tags.add(company_tag(company_id))
+
+    invalidate_tags(*tags)
+    for callback in callbacks:
+        callback()
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _after_rollback(session):
+    for key in ("wrote", "cache_tags", "on_commit"):
+        session.info.pop(key, None)
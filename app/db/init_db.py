@@ -1,9 +1,31 @@
-from app.db.session import SessionLocal
+from fastapi import Request
 
+from app.core.auth import get_user_id
+from app.db import hooks  # registers the SessionLocal commit hooks
+from app.db.session import SessionLocal, AsyncSessionLocal
+from app.db.replica import ReadSessionLocal, next_replica_engine, has_recent_write
 
-def get_db():
+
+def get_db(request: Request):
     db = SessionLocal()
+    db.info["sticky_key"] = get_user_id(request)
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_read_db(request: Request):
+    replica = next_replica_engine()
+    if replica is None or await has_recent_write(get_user_id(request)):
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+
+    async with ReadSessionLocal(bind=replica) as db:
+        yield db
@@ -0,0 +1,62 @@
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.models import (
+    Employee,
+    JobPosition,
+    JobApplication,
+    JobInterview,
+    CompetencyRubricLevel,
+)
+
+# Relationships default to lazy="raise_on_sql", so every route declares the
+# object graph it needs here and applies it with `.options(*loader_profile(...))`.
+_EMPLOYEE_PROFILE = (
+    joinedload(Employee.job_position),
+    joinedload(Employee.company),
+)
+
+LOADER_PROFILES = {
+    "auth.me": _EMPLOYEE_PROFILE,
+    "auth.login": _EMPLOYEE_PROFILE,
+    "auth.signup": _EMPLOYEE_PROFILE,
+    "auth.refresh": (
+        joinedload(Employee.company),
+    ),
+    "recruiter.applications": (
+        joinedload(JobApplication.candidate),
+        joinedload(JobApplication.job_position),
+        selectinload(JobApplication.interviews)
+        .joinedload(JobInterview.competency),
+    ),
+    "recruiter.new_candidate": (
+        selectinload(JobPosition.competencies),
+    ),
+    "interviewer.interviews": (
+        joinedload(JobInterview.application)
+        .joinedload(JobApplication.candidate),
+        joinedload(JobInterview.application)
+        .joinedload(JobApplication.job_position),
+        joinedload(JobInterview.competency),
+    ),
+    "recruiter.dashboard": (
+        joinedload(JobInterview.application)
+        .joinedload(JobApplication.candidate),
+        joinedload(JobInterview.application)
+        .joinedload(JobApplication.job_position),
+        joinedload(JobInterview.competency),
+        joinedload(JobInterview.interviewer),
+    ),
+    "job.detail": (
+        selectinload(JobPosition.competencies),
+        selectinload(JobPosition.competency_rubric_levels)
+        .selectinload(CompetencyRubricLevel.indicators),
+        selectinload(JobPosition.interview_questions),
+    ),
+}
+
+
+def loader_profile(name: str) -> tuple:
+    try:
+        return LOADER_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown loader profile: {name}")
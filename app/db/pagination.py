@@ -0,0 +1,117 @@
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_, asc, desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+
+TOTAL_COLUMN = "total_count"
+
+_total_cache = TTLCache(maxsize=10000, ttl=settings.PAGINATION_TOTAL_CACHE_TTL_SECONDS)
+
+
+# ─── Cursor Encoding ───────────────────────────────────────
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _load(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "uuid" in value:
+            return UUID(value["uuid"])
+    return value
+
+
+def encode_cursor(order_key: str, sort_value: Any, row_id: int) -> str:
+    raw = json.dumps({"o": order_key, "k": [_dump(sort_value), row_id]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_key: str) -> tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort_value, row_id = data["k"]
+        if data["o"] != order_key or not isinstance(row_id, int):
+            raise ValueError
+        return _load(sort_value), row_id
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid or mismatched cursor")
+
+
+# ─── Keyset Clauses ────────────────────────────────────────
+def keyset_order(sort_column, id_column, direction: str) -> list:
+    """ORDER BY for keyset pages; NULL sort keys always come last."""
+    order_fn = asc if direction == "asc" else desc
+    clauses = [order_fn(id_column)]
+    if sort_column is not None:
+        clauses.insert(0, order_fn(sort_column).nulls_last())
+    return clauses
+
+
+def keyset_predicate(sort_column, id_column, direction: str, sort_value: Any, row_id: int):
+    """Rows strictly after (sort_value, row_id) in `keyset_order` order."""
+    after = (lambda col, value: col > value) if direction == "asc" else (lambda col, value: col < value)
+
+    if sort_column is None:
+        return after(id_column, row_id)
+    if sort_value is None:
+        return and_(sort_column.is_(None), after(id_column, row_id))
+    return or_(
+        after(sort_column, sort_value),
+        and_(sort_column == sort_value, after(id_column, row_id)),
+        sort_column.is_(None),
+    )
+
+
+def next_cursor(order_key: str, rows: Sequence, limit: int, key_fn) -> Optional[str]:
+    """Cursor for the page after `rows`, which were fetched with `limit + 1`."""
+    if len(rows) <= limit:
+        return None
+    sort_value, row_id = key_fn(rows[limit - 1])
+    return encode_cursor(order_key, sort_value, row_id)
+
+
+# ─── Totals ────────────────────────────────────────────────
+def with_window_total(query):
+    """Adds count(*) OVER () so the page rows carry the total of the filtered set."""
+    return query.add_columns(func.count().over().label(TOTAL_COLUMN))
+
+
+async def page_total(
+        db: AsyncSession,
+        count_query,
+        rows: Sequence,
+        scope_key: str,
+        windowed: bool,
+) -> int:
+    """
+    Total for a page. Offset pages read it from the window column; cursor pages
+    (whose window only sees the remaining rows) reuse the total cached for the
+    same scope and fall back to a COUNT query.
+    """
+    if windowed and rows:
+        total = getattr(rows[0], TOTAL_COLUMN)
+    else:
+        total = _total_cache.get(scope_key)
+        if total is not None:
+            return total
+        total = await db.scalar(select(func.count()).select_from(count_query.subquery()))
+
+    _total_cache.set(scope_key, total)
+    return total
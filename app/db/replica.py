@@ -0,0 +1,49 @@
+from itertools import cycle
+
+from redis import RedisError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.core.config import settings
+from app.core.redis import redis_client, async_redis_client
+from app.db.pool import InstrumentedAsyncQueuePool
+from app.db.session import to_async_url, engine_options
+
+RECENT_WRITE_KEY = "db:recent-write:{}"
+
+replica_engines = []
+for replica_url in settings.DATABASE_REPLICA_URLS:
+    replica_url = to_async_url(replica_url)
+    replica_engines.append(
+        create_async_engine(replica_url, **engine_options(replica_url, InstrumentedAsyncQueuePool))
+    )
+
+_replica_cycle = cycle(replica_engines) if replica_engines else None
+
+ReadSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+
+def next_replica_engine():
+    return next(_replica_cycle) if _replica_cycle else None
+
+
+# ─── Read-your-writes stickiness ───────────────────────────
+def mark_recent_write(user_key: str) -> None:
+    if not replica_engines or not user_key or user_key == "anonymous":
+        return
+    try:
+        redis_client.set(
+            RECENT_WRITE_KEY.format(user_key), 1, ex=settings.READ_AFTER_WRITE_SECONDS
+        )
+    except RedisError:
+        pass
+
+
+async def has_recent_write(user_key: str) -> bool:
+    if not user_key or user_key == "anonymous":
+        return False
+    try:
+        return bool(await async_redis_client.exists(RECENT_WRITE_KEY.format(user_key)))
+    except RedisError:
+        # Without the marker we cannot prove the replica is safe to read from
+        return True
+
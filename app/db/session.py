@@ -1,14 +1,63 @@
-import os
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
 
+from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool, InstrumentedAsyncQueuePool
 
-load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+DATABASE_URL = settings.DATABASE_URL
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set. Check your .env file.")
 
-engine = create_engine(DATABASE_URL)
+
+def to_async_url(url: str) -> str:
+    async_url = make_url(url)
+    if async_url.drivername in ("postgresql", "postgresql+psycopg2"):
+        async_url = async_url.set(drivername="postgresql+asyncpg")
+    return async_url.render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or to_async_url(DATABASE_URL)
+
+
+def _connect_args(url: str) -> dict:
+    url = make_url(url)
+    if url.get_backend_name() != "postgresql":
+        return {}
+
+    timeout_ms = settings.DB_STATEMENT_TIMEOUT_MS
+    if url.get_driver_name() == "asyncpg":
+        server_settings = {"application_name": settings.DB_APPLICATION_NAME}
+        if timeout_ms:
+            server_settings["statement_timeout"] = str(timeout_ms)
+        return {"server_settings": server_settings}
+
+    connect_args = {"application_name": settings.DB_APPLICATION_NAME}
+    if timeout_ms:
+        connect_args["options"] = f"-c statement_timeout={timeout_ms}"
+    return connect_args
+
+
+def engine_options(url: str, poolclass) -> dict:
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": _connect_args(url),
+    }
+
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL, InstrumentedQueuePool))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL, InstrumentedAsyncQueuePool)
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
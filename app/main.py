@@ -8,8 +8,11 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
 
-from app.api.routes import auth, recruiter, job, interviewer
-from app.db.session import engine
+from app.api.routes import auth, recruiter, job, interviewer, internal
+from app.cache import start_invalidation_listener, stop_invalidation_listener
+from app.core.idempotency import IdempotencyMiddleware
+from app.db.replica import replica_engines
+from app.db.session import engine, async_engine
 from app.models import base
 from app.rate_limiter import limiter
 
@@ -25,6 +28,8 @@ app.state.limiter = limiter
 
 
 def setup_middlewares(app: FastAPI) -> None:
+    # Auth responses carry tokens and cookies, which should not be stored in Redis
+    app.add_middleware(IdempotencyMiddleware, exclude_prefixes=(f"{API_PREFIX}/auth",))
     app.add_middleware(SlowAPIMiddleware)
 
     frontend_url = os.getenv("FRONTEND_URL", "").strip()
@@ -50,6 +55,7 @@ def setup_routers(app: FastAPI) -> None:
     app.include_router(recruiter.router, prefix="/api/recruiter", tags=["Recruiter"])
     app.include_router(job.router, prefix="/api/job", tags=["Job"])
     app.include_router(interviewer.router, prefix="/api/interviewer", tags=["Interviewer"])
+    app.include_router(internal.router, prefix="/internal", tags=["Internal"], include_in_schema=False)
 
 
 @app.exception_handler(RateLimitExceeded)
@@ -66,13 +72,18 @@ def health_check():
 
 
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     base.Base.metadata.create_all(bind=engine)
+    start_invalidation_listener()
     print(f"{APP_NAME} v{APP_VERSION} startup complete")
 
 
 @app.on_event("shutdown")
-def on_shutdown():
+async def on_shutdown():
+    await stop_invalidation_listener()
+    await async_engine.dispose()
+    for replica in replica_engines:
+        await replica.dispose()
     print(f"{APP_NAME} shutdown complete")
 
 
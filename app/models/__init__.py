@@ -2,6 +2,8 @@ from .core import (
     Company,
     Employee,
     JobPosition,
+    JobPositionStats,
+    InterviewerStats,
     JobType,
     PositionEnum,
 )
@@ -33,6 +35,8 @@ __all__ = [
     "Company",
     "Employee",
     "JobPosition",
+    "JobPositionStats",
+    "InterviewerStats",
     "JobType",
     "PositionEnum",
 
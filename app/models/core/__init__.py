@@ -1,5 +1,7 @@
 from .company import Company
 from .employee import Employee, RoleEnum
 from .job_position import JobPosition, PositionEnum, JobType
+from .job_position_stats import JobPositionStats
+from .interviewer_stats import InterviewerStats
 
-__all__ = ["Company", "Employee", "RoleEnum", "JobPosition", "PositionEnum", "JobType"]
+__all__ = ["Company", "Employee", "RoleEnum", "JobPosition", "PositionEnum", "JobType", "JobPositionStats", "InterviewerStats"]
@@ -0,0 +1,7 @@
+from sqlalchemy import Integer, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+def counter_column() -> Mapped[int]:
+    """A non-null integer counter starting at 0, for the maintained stats tables."""
+    return mapped_column(Integer, nullable=False, default=0, server_default=text("0"))
@@ -34,7 +34,7 @@ class Company(AbstractBaseModel, Base):
         back_populates="company",
         cascade="all, delete-orphan",
         passive_deletes=True,
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     employees: Mapped[List["Employee"]] = relationship(
@@ -42,6 +42,6 @@ class Company(AbstractBaseModel, Base):
         back_populates="company",
         cascade="all, delete-orphan",
         passive_deletes=True,
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
@@ -48,18 +48,22 @@ class Employee(AbstractBaseModel, AbstractPersonMixin, Base):
     company_id: Mapped[int] = mapped_column(
         ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True
     )
+    # Embedded in access tokens; bumping it revokes every token issued before
+    token_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default=text("1")
+    )
 
     job_position: Mapped["JobPosition"] = relationship(
-        "JobPosition", back_populates="employees", passive_deletes=True, lazy="selectin"
+        "JobPosition", back_populates="employees", passive_deletes=True, lazy="raise_on_sql"
     )
 
     interviews: Mapped[List["JobInterview"]] = relationship(
         "JobInterview",
         back_populates="interviewer",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     company: Mapped["Company"] = relationship(
-        "Company", back_populates="employees", passive_deletes=True, lazy="selectin"
+        "Company", back_populates="employees", passive_deletes=True, lazy="raise_on_sql"
     )
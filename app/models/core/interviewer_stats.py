@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import ForeignKey, Integer, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.models.core.columns import counter_column
+
+
+class InterviewerStats(Base):
+    """Per-employee interview workload kept by the write paths (see app/services/interviewer_stats.py)."""
+
+    __tablename__ = "interviewer_stats"
+
+    employee_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("employees.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    interviews_total: Mapped[int] = counter_column()
+    interviews_not_scheduled: Mapped[int] = counter_column()
+    interviews_scheduled: Mapped[int] = counter_column()
+    interviews_rescheduled: Mapped[int] = counter_column()
+    interviews_cancelled: Mapped[int] = counter_column()
+    interviews_completed: Mapped[int] = counter_column()
+    interviews_no_show: Mapped[int] = counter_column()
+    interviews_feedback_pending: Mapped[int] = counter_column()
+
+    # Latest interview time of any assigned interview, and the earliest upcoming scheduled one
+    last_interview_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    next_interview_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from enum import Enum
 from typing import List
-from sqlalchemy import String, ForeignKey, Enum as SqlEnum, Integer, text
+from sqlalchemy import String, ForeignKey, Enum as SqlEnum, Integer, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.associations.recruitment import job_position_competency_mappings
@@ -23,6 +23,13 @@ class JobType(str, Enum):
 
 class JobPosition(AbstractBaseModel, Base):
     __tablename__ = "job_positions"
+    __table_args__ = (
+        Index(
+            "ix_job_positions_title_trgm",
+            text("lower(title) gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     status: Mapped[PositionEnum] = mapped_column(
@@ -44,15 +51,23 @@ class JobPosition(AbstractBaseModel, Base):
         nullable=False,
         index=True,
     )
+    # Bumped whenever the rubric tree is rewritten; keys the cached GET /api/job/{id} payload
+    content_version: Mapped[int] = mapped_column(
+        Integer, default=1, server_default=text("1"), nullable=False
+    )
+    # Hidden from every listing while the background purge removes the subtree
+    is_deleted: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=text("false"), nullable=False, index=True
+    )
 
     company: Mapped["Company"] = relationship(
-        "Company", back_populates="job_positions", passive_deletes=True
+        "Company", back_populates="job_positions", passive_deletes=True, lazy="raise_on_sql"
     )
 
     employees: Mapped[List["Employee"]] = relationship(
         "Employee",
         back_populates="job_position",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -61,28 +76,31 @@ class JobPosition(AbstractBaseModel, Base):
         "JobApplication",
         back_populates="job_position",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     competencies: Mapped[List["Competency"]] = relationship(
         "Competency",
         secondary=job_position_competency_mappings,
         back_populates="job_positions",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     interview_questions: Mapped[List["InterviewQuestion"]] = relationship(
         "InterviewQuestion",
         back_populates="job_position",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     competency_rubric_levels: Mapped[List["CompetencyRubricLevel"]] = relationship(
         "CompetencyRubricLevel",
         back_populates="job_position",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
 
@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import ForeignKey, Integer, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.models.core.columns import counter_column
+
+
+class JobPositionStats(Base):
+    """Per-job counters maintained by the write paths (see app/services/job_stats.py)."""
+
+    __tablename__ = "job_position_stats"
+
+    job_position_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("job_positions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    competency_count: Mapped[int] = counter_column()
+
+    applications_total: Mapped[int] = counter_column()
+    applications_pending: Mapped[int] = counter_column()
+    applications_hire: Mapped[int] = counter_column()
+    applications_reject: Mapped[int] = counter_column()
+
+    interviews_not_scheduled: Mapped[int] = counter_column()
+    interviews_scheduled: Mapped[int] = counter_column()
+    interviews_rescheduled: Mapped[int] = counter_column()
+    interviews_cancelled: Mapped[int] = counter_column()
+    interviews_completed: Mapped[int] = counter_column()
+    interviews_no_show: Mapped[int] = counter_column()
+    interviews_feedback_pending: Mapped[int] = counter_column()
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
@@ -1,6 +1,6 @@
 from typing import List
 
-from sqlalchemy import String, Boolean
+from sqlalchemy import String, Boolean, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from app.models.associations.recruitment import job_position_competency_mappings
@@ -10,8 +10,20 @@ from app.models.base import Base
 
 class Competency(AbstractBaseModel, Base):
     __tablename__ = "competencies"
+    __table_args__ = (
+        UniqueConstraint("company_id", "normalized_name", name="uq_competencies_company_normalized_name"),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    # Lower-cased, whitespace-collapsed name; unique per company
+    normalized_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    # NULL for legacy competencies shared across companies
+    company_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
     description: Mapped[str] = mapped_column(String, nullable=False)
     is_active: Mapped[bool] = mapped_column(
         Boolean, default=True, nullable=False, index=True
@@ -21,13 +33,13 @@ class Competency(AbstractBaseModel, Base):
         "JobPosition",
         secondary=job_position_competency_mappings,
         back_populates="competencies",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     interviews: Mapped[List["JobInterview"]] = relationship(
         "JobInterview",
         back_populates="competency",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -36,12 +48,12 @@ class Competency(AbstractBaseModel, Base):
         "InterviewQuestion",
         back_populates="competency",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     rubric_levels: Mapped[List["CompetencyRubricLevel"]] = relationship(
         "CompetencyRubricLevel",
         back_populates="competency",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
@@ -42,17 +42,18 @@ class CompetencyRubricLevel(AbstractBaseModel, Base):
         "EvaluationIndicator",
         back_populates="rubric_level",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     competency: Mapped["Competency"] = relationship(
         "Competency",
         back_populates="rubric_levels",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     job_position: Mapped["JobPosition"] = relationship(
         "JobPosition",
         back_populates="competency_rubric_levels",
-        lazy="selectin"
+        lazy="raise_on_sql"
     )
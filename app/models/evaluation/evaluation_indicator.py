@@ -13,10 +13,11 @@ class EvaluationIndicator(AbstractBaseModel, Base):
     rubric_level_id: Mapped[int] = mapped_column(
         ForeignKey("competency_rubric_levels.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
 
     rubric_level: Mapped["CompetencyRubricLevel"] = relationship(
         "CompetencyRubricLevel",
         back_populates="indicators",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
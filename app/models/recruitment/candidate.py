@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from typing import List
 
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy import String, Boolean, Computed, Index, func, literal_column, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.abstract_base import AbstractBaseModel
 from app.models.base import Base
@@ -11,10 +12,58 @@ from app.models.personal_base import AbstractPersonMixin
 
 class Candidate(AbstractBaseModel, AbstractPersonMixin, Base):
     __tablename__ = "candidates"
+    __table_args__ = (
+        Index(
+            "ix_candidates_full_name_trgm",
+            "full_name",
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_candidates_email_trgm",
+            text("lower(email) gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_candidates_search_document",
+            text(
+                "to_tsvector('simple'::regconfig, coalesce(first_name, '') || ' ' "
+                "|| coalesce(last_name, '') || ' ' || coalesce(email, ''))"
+            ),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    # Lower-cased "first last", kept by the database for trigram search
+    full_name: Mapped[str] = mapped_column(
+        String,
+        Computed("lower(coalesce(first_name, '') || ' ' || coalesce(last_name, ''))", persisted=True),
+        nullable=True,
+    )
+
+    # Hidden from every listing while the background purge removes the subtree
+    is_deleted: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=text("false"), nullable=False, index=True
+    )
 
     job_applications: Mapped[List["JobApplication"]] = relationship(
         "JobApplication",
         back_populates="candidate",
         passive_deletes=True,
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
+
+
+def candidate_search_document(table):
+    """
+    tsvector over name and email. Must stay the same expression as
+    ix_candidates_search_document so searches can use the index.
+    """
+    blank, space = literal_column("''"), literal_column("' '")
+    return func.to_tsvector(
+        literal_column("'simple'::regconfig"),
+        func.coalesce(table.c.first_name, blank) + space
+        + func.coalesce(table.c.last_name, blank) + space
+        + func.coalesce(table.c.email, blank),
+    )
+
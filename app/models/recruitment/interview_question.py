@@ -39,11 +39,11 @@ class InterviewQuestion(AbstractBaseModel, Base):
     competency: Mapped["Competency"] = relationship(
         "Competency",
         back_populates="interview_questions",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     job_position: Mapped["JobPosition"] = relationship(
         "JobPosition",
         back_populates="interview_questions",
-        lazy="selectin"
+        lazy="raise_on_sql"
     )
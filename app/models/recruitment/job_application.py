@@ -51,19 +51,20 @@ class JobApplication(AbstractBaseModel, Base):
         "Candidate",
         back_populates="job_applications",
         passive_deletes=True,
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     job_position: Mapped["JobPosition"] = relationship(
         "JobPosition",
         back_populates="job_applications",
         passive_deletes=True,
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     interviews: Mapped[List["JobInterview"]] = relationship(
         "JobInterview",
         back_populates="application",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
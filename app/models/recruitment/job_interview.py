@@ -55,17 +55,17 @@ class JobInterview(AbstractBaseModel, Base):
     )
 
     application: Mapped["JobApplication"] = relationship(
-        "JobApplication", back_populates="interviews", lazy="selectin"
+        "JobApplication", back_populates="interviews", lazy="raise_on_sql"
     )
 
     interviewer: Mapped["Employee"] = relationship(
         "Employee",
         back_populates="interviews",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     competency: Mapped["Competency"] = relationship(
         "Competency",
         back_populates="interviews",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
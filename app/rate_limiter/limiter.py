@@ -1,12 +1,9 @@
-import os
-
 from slowapi import Limiter
 from app.core.auth import get_user_id
-
-REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+from app.core.config import settings
 
 limiter = Limiter(
     key_func=get_user_id,
-    storage_uri=REDIS_URL,
+    storage_uri=settings.REDIS_URL,
     enabled=True
-)
\ No newline at end of file
+)
@@ -1,3 +1,4 @@
+from typing import List, Optional
 from uuid import UUID
 from pydantic import BaseModel, EmailStr, Field
 from app.schemas.phone_number import PhoneNumberOut
@@ -29,3 +30,44 @@ class CandidateMinimal(CandidateBase):
         from_attributes=True,
         populate_by_name=True,
     )
+
+
+class CandidateApplicationMinimal(BaseModel):
+    public_id: UUID = Field(alias="job_application_public_id")
+    status: str
+    job_position_public_id: UUID
+    job_position_title: str
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+    )
+
+
+class CandidateSearchHit(CandidateOut):
+    applications: List[CandidateApplicationMinimal]
+
+
+class PaginatedCandidateSearchResponse(BaseModel):
+    candidates: List[CandidateSearchHit]
+    limit: int
+    next_cursor: Optional[str] = None
+
+
+class CandidateImportRow(BaseModel):
+    first_name: str = Field(min_length=1, max_length=255)
+    last_name: str = Field(min_length=1, max_length=255)
+    email: EmailStr = Field(max_length=128)
+    phone_number_raw: str = Field(min_length=1, max_length=20)
+    phone_country_code: str = Field(min_length=1, max_length=8)
+
+
+class CandidateImportError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class CandidateImportReport(BaseModel):
+    imported: int
+    failed: int
+    errors: List[CandidateImportError]
@@ -0,0 +1,18 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.schemas.job_interview import InterviewBase
+
+
+class DashboardInterview(InterviewBase):
+    interviewer_name: Optional[str] = None
+
+
+class RecruiterDashboardResponse(BaseModel):
+    jobs_by_status: Dict[str, int]
+    applications_by_status: Dict[str, int]
+    interviews_by_status: Dict[str, int]
+    upcoming_interviews: List[DashboardInterview]
+    unscheduled_backlog: int
+    oldest_unscheduled: List[DashboardInterview]
@@ -60,6 +60,7 @@ class EmployeeInterviewerOut(BaseModel):
     public_id: UUID = Field(alias="employee_public_id")
     interview_count: int
     last_interviewed_at: Optional[str]
+    next_interview_at: Optional[str] = None
     job_position: JobMinimal
     phone_number: PhoneNumberOut
 
@@ -73,6 +74,7 @@ class PaginatedEmployeeResponse(BaseModel):
     employees: List[EmployeeInterviewerOut]
     candidate: CandidateMinimal
     competency: CompetencyMinimal
-    total: int
+    total: Optional[int]
     page: int
     limit: int
+    next_cursor: Optional[str] = None
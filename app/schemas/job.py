@@ -47,6 +47,7 @@ class JobPut(BaseModel):
 
 class PaginatedJobResponse(BaseModel):
     jobs: List[JobOut]
-    total: int
+    total: Optional[int]
     page: int
     limit: int
+    next_cursor: Optional[str] = None
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -28,6 +28,7 @@ class ApplicationOut(ApplicationBase):
 class PaginatedApplicationResponse(BaseModel):
     applications: List[ApplicationOut]
     job_position: JobMinimal
-    total: int
+    total: Optional[int]
     page: int
     limit: int
+    next_cursor: Optional[str] = None
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, conlist
 
 from app.models.recruitment.job_interview import InterviewStatusEnum
 from app.schemas.candidate import CandidateMinimal
@@ -43,6 +43,46 @@ class InterviewWithMeta(BaseModel):
 
 class PaginatedInterviewResponse(BaseModel):
     interviews: List[InterviewOut]
-    total: int
+    total: Optional[int]
     page: int
     limit: int
+    next_cursor: Optional[str] = None
+
+
+class InterviewScheduleItem(BaseModel):
+    job_interview_public_id: UUID
+    employee_public_id: UUID
+    interview_datetime: datetime
+
+
+class InterviewScheduleRequest(BaseModel):
+    items: conlist(InterviewScheduleItem, min_length=1, max_length=500)
+
+
+class InterviewScheduleResult(BaseModel):
+    job_interview_public_id: UUID
+    success: bool
+    detail: Optional[str] = None
+
+
+class InterviewScheduleResponse(BaseModel):
+    scheduled: int
+    failed: int
+    results: List[InterviewScheduleResult]
+
+
+class InterviewAutoAssignRequest(BaseModel):
+    job_position_public_id: Optional[UUID] = None
+    dry_run: bool = True
+
+
+class InterviewAssignmentOut(BaseModel):
+    job_interview_public_id: UUID
+    employee_public_id: UUID
+    cost: float
+
+
+class InterviewAutoAssignResponse(BaseModel):
+    dry_run: bool
+    assigned: int
+    assignments: List[InterviewAssignmentOut]
@@ -0,0 +1,215 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, List, Optional, Sequence
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import (
+    Candidate,
+    JobApplication,
+    JobApplicationStatus,
+    JobInterview,
+    InterviewStatusEnum,
+)
+from app.schemas.candidate import CandidateImportError, CandidateImportReport, CandidateImportRow
+from app.services.job_stats import record_applications
+
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+IMPORT_FIELDS = tuple(CandidateImportRow.model_fields)
+
+
+# ─── Parsing ───────────────────────────────────────────────
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str]]:
+    """(line_number, line) pairs from a byte stream, without buffering the whole body."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer, line_number = "", 0
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield line_number + 1, buffer.rstrip("\r")
+
+
+async def iter_records(
+        lines: AsyncIterator[tuple[int, str]],
+        content_type: str,
+) -> AsyncIterator[tuple[int, Optional[dict], Optional[str]]]:
+    """
+    (line_number, record, error) per non-blank line. CSV needs a header row
+    naming the import fields; quoted fields may not span lines.
+    Raises ValueError for an unusable header.
+    """
+    header = None
+    async for line_number, line in lines:
+        if not line.strip():
+            continue
+
+        if content_type in NDJSON_CONTENT_TYPES:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield line_number, None, "Invalid JSON"
+                continue
+            if not isinstance(record, dict):
+                yield line_number, None, "Expected a JSON object"
+                continue
+            yield line_number, record, None
+            continue
+
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [value.strip() for value in values]
+            missing = [field for field in IMPORT_FIELDS if field not in header]
+            if missing:
+                raise ValueError(f"CSV header is missing columns: {', '.join(missing)}")
+            continue
+        if len(values) != len(header):
+            yield line_number, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield line_number, dict(zip(header, values)), None
+
+
+def validate_record(record: dict) -> tuple[Optional[CandidateImportRow], List[str]]:
+    try:
+        return CandidateImportRow.model_validate(record), []
+    except ValidationError as e:
+        return None, [
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        ]
+
+
+# ─── Writing ───────────────────────────────────────────────
+class CandidateImporter:
+    """
+    Collects validated rows and writes them a batch per transaction:
+    candidates, applications and NOT_SCHEDULED interviews as multi-row
+    INSERTs. Candidates that already exist (by email) are reused.
+    """
+
+    def __init__(self, db: Session, job_position_id: int, competency_ids: Sequence[int]):
+        self.db = db
+        self.job_position_id = job_position_id
+        self.competency_ids = list(competency_ids)
+        self.batch_size = settings.CANDIDATE_IMPORT_BATCH_SIZE
+        self.pending: List[tuple[int, CandidateImportRow]] = []
+        self.seen_emails = set()
+        self.imported = 0
+        self.errors: List[CandidateImportError] = []
+
+    @property
+    def full(self) -> bool:
+        return len(self.pending) >= self.batch_size
+
+    def reject(self, row: int, errors: List[str]) -> None:
+        self.errors.append(CandidateImportError(row=row, errors=errors))
+
+    def add(self, row: int, record: Optional[dict], error: Optional[str]) -> None:
+        if error:
+            self.reject(row, [error])
+            return
+
+        candidate, errors = validate_record(record)
+        if errors:
+            self.reject(row, errors)
+        elif candidate.email in self.seen_emails:
+            self.reject(row, [f"Duplicate email in import: {candidate.email}"])
+        else:
+            self.seen_emails.add(candidate.email)
+            self.pending.append((row, candidate))
+
+    def flush(self) -> None:
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        errors_before, imported_before = len(self.errors), self.imported
+        try:
+            self._write(batch)
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            del self.errors[errors_before:]
+            self.imported = imported_before
+            for row, _ in batch:
+                self.reject(row, ["Batch conflicted with a concurrent write; retry these rows"])
+
+    def _write(self, batch: List[tuple[int, CandidateImportRow]]) -> None:
+        db = self.db
+        emails = [candidate.email for _, candidate in batch]
+
+        candidate_ids, deleting = {}, set()
+        for email, candidate_id, is_deleted in db.execute(
+                select(Candidate.email, Candidate.id, Candidate.is_deleted).where(Candidate.email.in_(emails))
+        ):
+            candidate_ids[email] = candidate_id
+            if is_deleted:
+                deleting.add(candidate_id)
+
+        new_candidates = [
+            candidate.model_dump() for _, candidate in batch if candidate.email not in candidate_ids
+        ]
+        if new_candidates:
+            candidate_ids.update(db.execute(
+                insert(Candidate).returning(Candidate.email, Candidate.id), new_candidates
+            ).all())
+
+        applied = set(db.scalars(
+            select(JobApplication.candidate_id).where(
+                JobApplication.job_position_id == self.job_position_id,
+                JobApplication.candidate_id.in_(candidate_ids.values()),
+            )
+        ))
+
+        application_rows = []
+        for row, candidate in batch:
+            candidate_id = candidate_ids[candidate.email]
+            if candidate_id in deleting:
+                self.reject(row, [f"{candidate.email} is being deleted; retry later"])
+                continue
+            if candidate_id in applied:
+                self.reject(row, [f"{candidate.email} already applied to this job position"])
+                continue
+            application_rows.append({
+                "candidate_id": candidate_id,
+                "job_position_id": self.job_position_id,
+                "status": JobApplicationStatus.PENDING,
+            })
+        if not application_rows:
+            return
+
+        application_ids = db.scalars(
+            insert(JobApplication).returning(JobApplication.id), application_rows
+        ).all()
+
+        if self.competency_ids:
+            db.execute(insert(JobInterview), [
+                {
+                    "application_id": application_id,
+                    "competency_id": competency_id,
+                    "interview_status": InterviewStatusEnum.NOT_SCHEDULED,
+                }
+                for application_id in application_ids
+                for competency_id in self.competency_ids
+            ])
+
+        record_applications(
+            db, self.job_position_id, JobApplicationStatus.PENDING, len(application_ids),
+            interview_deltas={
+                InterviewStatusEnum.NOT_SCHEDULED: len(application_ids) * len(self.competency_ids)
+            },
+        )
+        self.imported += len(application_ids)
+
+    def report(self) -> CandidateImportReport:
+        errors = sorted(self.errors, key=lambda error: error.row)
+        return CandidateImportReport(imported=self.imported, failed=len(errors), errors=errors)
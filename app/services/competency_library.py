@@ -0,0 +1,77 @@
+from typing import Dict, Sequence
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+from app.models import Competency
+
+# company_id -> {normalized name: competency id}
+_library = TTLCache(maxsize=settings.COMPETENCY_LIBRARY_CACHE_SIZE, ttl=settings.COMPETENCY_LIBRARY_TTL_SECONDS)
+
+
+def normalize_competency_name(name: str) -> str:
+    return " ".join(name.split()).lower()
+
+
+def invalidate_library(company_id: int) -> None:
+    _library.pop(company_id)
+
+
+def library_index(db: Session, company_id: int) -> Dict[str, int]:
+    """
+    The company's competency index, loaded on first use. Legacy global
+    competencies (company_id NULL) are included so jobs still pointing at them
+    keep resolving to them; the company's own row wins on a name clash.
+    """
+    index = _library.get(company_id)
+    if index is None:
+        index = {}
+        for normalized, competency_id, owner_id in db.execute(
+                select(Competency.normalized_name, Competency.id, Competency.company_id)
+                .where(or_(Competency.company_id == company_id, Competency.company_id.is_(None)))
+                .order_by(Competency.id)
+        ):
+            if owner_id is not None or normalized not in index:
+                index[normalized] = competency_id
+        _library.set(company_id, index)
+    return index
+
+
+def resolve_competencies(db: Session, company_id: int, entries: Sequence[tuple[str, str]]) -> Dict[str, int]:
+    """
+    Maps each (name, description) entry's name to the company's competency
+    id. Known names are dictionary hits; the rest are created with one
+    INSERT ... ON CONFLICT, which also returns rows a concurrent save
+    created first, so a name never ends up duplicated.
+    """
+    index = library_index(db, company_id)
+
+    resolved, missing = {}, {}
+    for name, description in entries:
+        normalized = normalize_competency_name(name)
+        if normalized in index:
+            resolved[name] = index[normalized]
+        else:
+            missing.setdefault(normalized, (name, description))
+
+    if missing:
+        statement = insert(Competency).values([
+            {"company_id": company_id, "name": name, "normalized_name": normalized, "description": description}
+            for normalized, (name, description) in missing.items()
+        ])
+        statement = statement.on_conflict_do_update(
+            index_elements=[Competency.company_id, Competency.normalized_name],
+            # A no-op update so RETURNING includes rows that already existed
+            set_={"normalized_name": statement.excluded.normalized_name},
+        ).returning(Competency.normalized_name, Competency.id)
+        created = dict(db.execute(statement).all())
+
+        # The new rows are uncommitted; reload the index on next use instead of caching them
+        invalidate_library(company_id)
+        for name, _ in entries:
+            resolved.setdefault(name, created.get(normalize_competency_name(name)))
+
+    return resolved
@@ -0,0 +1,110 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import TwoTierCache, company_tag
+from app.core.config import settings
+from app.db.loaders import loader_profile
+from app.models import (
+    Candidate,
+    JobApplication,
+    JobInterview,
+    JobPosition,
+    JobPositionStats,
+    JobType,
+    InterviewStatusEnum,
+    PositionEnum,
+)
+from app.schemas.dashboard import DashboardInterview, RecruiterDashboardResponse
+from app.services.interviewer_stats import UPCOMING_STATUSES
+from app.services.job_stats import APPLICATION_STATUS_COLUMNS, INTERVIEW_STATUS_COLUMNS
+
+_dashboard_cache = TwoTierCache(
+    "dashboard", maxsize=settings.DASHBOARD_CACHE_SIZE, ttl=settings.DASHBOARD_CACHE_TTL_SECONDS
+)
+
+
+def _company_jobs(company_id: int) -> tuple:
+    return (
+        JobPosition.company_id == company_id,
+        JobPosition.job_type == JobType.EXTERNAL,
+        JobPosition.is_deleted.is_(False),
+    )
+
+
+def _dashboard_interview(interview: JobInterview) -> DashboardInterview:
+    interviewer = interview.interviewer
+    return DashboardInterview(
+        public_id=interview.public_id,
+        interview_datetime=interview.interview_datetime,
+        interview_status=interview.interview_status,
+        competency=interview.competency,
+        candidate=interview.application.candidate,
+        job_position=interview.application.job_position,
+        interviewer_name=f"{interviewer.first_name} {interviewer.last_name}" if interviewer else None,
+    )
+
+
+async def build_dashboard(db: AsyncSession, company_id: int) -> RecruiterDashboardResponse:
+    """Four queries: job statuses, summed per-job stats, and the two interview lists."""
+    jobs_by_status = {status.value: 0 for status in PositionEnum}
+    for status, count in await db.execute(
+            select(JobPosition.status, func.count())
+            .where(*_company_jobs(company_id))
+            .group_by(JobPosition.status)
+    ):
+        jobs_by_status[status.value] = count
+
+    # Application and interview breakdowns are sums of the maintained per-job counters
+    counter_columns = {**APPLICATION_STATUS_COLUMNS, **INTERVIEW_STATUS_COLUMNS}
+    totals = (await db.execute(
+        select(*(
+            func.coalesce(func.sum(getattr(JobPositionStats, column)), 0).label(column)
+            for column in counter_columns.values()
+        ))
+        .join(JobPosition, JobPosition.id == JobPositionStats.job_position_id)
+        .where(*_company_jobs(company_id))
+    )).one()._mapping
+
+    interviews = (
+        select(JobInterview)
+        .join(JobInterview.application)
+        .join(JobApplication.candidate)
+        .join(JobApplication.job_position)
+        .where(*_company_jobs(company_id), Candidate.is_deleted.is_(False))
+        .options(*loader_profile("recruiter.dashboard"))
+        .limit(settings.DASHBOARD_LIST_LIMIT)
+    )
+    upcoming = await db.scalars(
+        interviews.where(
+            JobInterview.interview_status.in_(UPCOMING_STATUSES),
+            JobInterview.interview_datetime > datetime.now(timezone.utc),
+        ).order_by(JobInterview.interview_datetime, JobInterview.id)
+    )
+    oldest_unscheduled = await db.scalars(
+        interviews.where(JobInterview.interview_status == InterviewStatusEnum.NOT_SCHEDULED)
+        .order_by(JobInterview.created_at, JobInterview.id)
+    )
+
+    return RecruiterDashboardResponse(
+        jobs_by_status=jobs_by_status,
+        applications_by_status={
+            status.value: totals[column] for status, column in APPLICATION_STATUS_COLUMNS.items()
+        },
+        interviews_by_status={
+            status.value: totals[column] for status, column in INTERVIEW_STATUS_COLUMNS.items()
+        },
+        upcoming_interviews=[_dashboard_interview(i) for i in upcoming],
+        unscheduled_backlog=totals[INTERVIEW_STATUS_COLUMNS[InterviewStatusEnum.NOT_SCHEDULED]],
+        oldest_unscheduled=[_dashboard_interview(i) for i in oldest_unscheduled],
+    )
+
+
+async def dashboard_bytes(db: AsyncSession, company_id: int) -> bytes:
+    """JSON-encoded dashboard, cached per company until its TTL or the company's next write."""
+    async def build() -> bytes:
+        dashboard = await build_dashboard(db, company_id)
+        return dashboard.model_dump_json(by_alias=True).encode()
+
+    return await _dashboard_cache.get_or_set(str(company_id), build, tags=[company_tag(company_id)])
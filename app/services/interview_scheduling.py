@@ -0,0 +1,96 @@
+from collections import defaultdict
+from typing import List, Sequence
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models import Employee, JobApplication, JobInterview, JobPosition, InterviewStatusEnum
+from app.models.core import RoleEnum
+from app.schemas.job_interview import InterviewScheduleItem, InterviewScheduleResult
+from app.services.interviewer_stats import refresh_interviewer_stats
+from app.services.job_stats import record_interviews
+
+INTERVIEWER_ROLES = (RoleEnum.interviewer, RoleEnum.recruiter)
+
+
+def schedule_interviews(
+        db: Session,
+        company_id: int,
+        items: Sequence[InterviewScheduleItem],
+) -> List[InterviewScheduleResult]:
+    """
+    Assigns interviewers and times to many interviews of one company.
+    Ids are resolved with one query per table and the accepted items are
+    written with a single bulk UPDATE, one stats update per job and one
+    interviewer stats refresh; the caller commits. Items that fail
+    validation are reported, not raised.
+    """
+    interviewers = dict(db.execute(
+        select(Employee.public_id, Employee.id).where(
+            Employee.public_id.in_({item.employee_public_id for item in items}),
+            Employee.company_id == company_id,
+            Employee.role.in_(INTERVIEWER_ROLES),
+        )
+    ).all())
+
+    interviews = {row.public_id: row for row in db.execute(
+        select(
+            JobInterview.public_id,
+            JobInterview.id,
+            JobInterview.interview_status,
+            JobInterview.interviewer_id,
+            JobApplication.job_position_id,
+        )
+        .join(JobApplication, JobApplication.id == JobInterview.application_id)
+        .join(JobPosition, JobPosition.id == JobApplication.job_position_id)
+        .where(
+            JobInterview.public_id.in_({item.job_interview_public_id for item in items}),
+            JobPosition.company_id == company_id,
+            JobPosition.is_deleted.is_(False),
+        )
+    )}
+
+    results, updates, seen, touched_interviewers = [], [], set(), set()
+    status_deltas = defaultdict(lambda: defaultdict(int))
+
+    for item in items:
+        interview = interviews.get(item.job_interview_public_id)
+        interviewer_id = interviewers.get(item.employee_public_id)
+
+        if interview is None:
+            detail = "Job interview not found or unauthorized"
+        elif interviewer_id is None:
+            detail = "Interviewer not found"
+        elif interview.id in seen:
+            detail = "Interview appears more than once in this request"
+        else:
+            detail = None
+
+        results.append(InterviewScheduleResult(
+            job_interview_public_id=item.job_interview_public_id,
+            success=detail is None,
+            detail=detail,
+        ))
+        if detail:
+            continue
+
+        seen.add(interview.id)
+        touched_interviewers.update((interview.interviewer_id, interviewer_id))
+        updates.append({
+            "id": interview.id,
+            "interviewer_id": interviewer_id,
+            "interview_datetime": item.interview_datetime,
+            "interview_status": InterviewStatusEnum.SCHEDULED,
+        })
+        if interview.interview_status != InterviewStatusEnum.SCHEDULED:
+            deltas = status_deltas[interview.job_position_id]
+            deltas[interview.interview_status] -= 1
+            deltas[InterviewStatusEnum.SCHEDULED] += 1
+
+    if updates:
+        db.execute(update(JobInterview), updates)
+    for job_position_id, deltas in status_deltas.items():
+        record_interviews(db, job_position_id, deltas)
+    refresh_interviewer_stats(db, touched_interviewers)
+
+    return results
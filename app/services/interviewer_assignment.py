@@ -0,0 +1,224 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+from uuid import UUID
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Candidate,
+    Employee,
+    InterviewerStats,
+    JobApplication,
+    JobInterview,
+    JobPosition,
+    InterviewStatusEnum,
+)
+from app.services.interview_scheduling import INTERVIEWER_ROLES
+from app.services.interviewer_stats import refresh_interviewer_stats
+from app.services.job_stats import INTERVIEW_STATUS_COLUMNS
+
+# Interviews that occupy an interviewer, and those that count as experience
+LOAD_STATUSES = (
+    InterviewStatusEnum.NOT_SCHEDULED,
+    InterviewStatusEnum.SCHEDULED,
+    InterviewStatusEnum.RESCHEDULED,
+)
+EXPERIENCE_STATUSES = (InterviewStatusEnum.COMPLETED, InterviewStatusEnum.FEEDBACK_PENDING)
+
+# Cost weights: one unit is one interview of current load
+LOAD_WEIGHT = 1.0
+RECENCY_WEIGHT = 0.5
+EXPERIENCE_WEIGHT = 0.75
+SAME_APPLICATION_PENALTY = 2.0
+RECENCY_HALF_LIFE_DAYS = 7.0
+
+
+@dataclass(frozen=True)
+class ProposedAssignment:
+    interview_id: int
+    interview_public_id: UUID
+    interviewer_id: int
+    interviewer_public_id: UUID
+    cost: float
+
+
+# ─── Solver ────────────────────────────────────────────────
+def level_quotas(load: np.ndarray, n: int) -> np.ndarray:
+    """
+    How many of n new interviews each interviewer may take: the lightest
+    loads are filled first, up to the lowest common level that fits all n.
+    """
+    load = np.ceil(load)
+    low, high = load.min(), load.min() + n
+    while low < high:
+        level = (low + high) // 2
+        if np.clip(level - load, 0, None).sum() >= n:
+            high = level
+        else:
+            low = level + 1
+    return np.clip(low - load, 0, None).astype(np.int64)
+
+
+def solve_assignment(
+        static_cost: np.ndarray,
+        initial_load: np.ndarray,
+        application_index: np.ndarray,
+        application_taken: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Load-balanced assignment of n interviews to m interviewers.
+
+    Current load decides how many interviews each interviewer gets
+    (`level_quotas`); who gets which is then solved round by round as a
+    min-cost matching over the interviewers with quota left, raising load and
+    marking the application as taken after each round. Returns the
+    interviewer column and final cost for every interview row.
+    """
+    n = static_cost.shape[0]
+    load = initial_load.astype(float)
+    quota = level_quotas(load, n)
+    taken = application_taken.copy()
+    columns = np.full(n, -1, dtype=np.int64)
+    costs = np.zeros(n)
+    remaining = np.arange(n)
+
+    while remaining.size:
+        open_columns = np.flatnonzero(quota)
+        cost = (
+            static_cost[np.ix_(remaining, open_columns)]
+            + LOAD_WEIGHT * load[np.newaxis, open_columns]
+            + SAME_APPLICATION_PENALTY * taken[np.ix_(application_index[remaining], open_columns)]
+        )
+        rows, cols = linear_sum_assignment(cost)
+        picked, interviewers = remaining[rows], open_columns[cols]
+
+        columns[picked] = interviewers
+        costs[picked] = cost[rows, cols]
+        load[interviewers] += 1
+        quota[interviewers] -= 1
+        taken[application_index[picked], interviewers] = True
+        remaining = np.delete(remaining, rows)
+
+    return columns, costs
+
+
+# ─── Planning ──────────────────────────────────────────────
+def plan_assignments(
+        db: Session,
+        company_id: int,
+        job_position_id: Optional[int] = None,
+) -> List[ProposedAssignment]:
+    """Proposes an interviewer for every unassigned NOT_SCHEDULED interview of a company or job."""
+    interview_query = (
+        select(
+            JobInterview.id,
+            JobInterview.public_id,
+            JobInterview.competency_id,
+            JobInterview.application_id,
+        )
+        .join(JobApplication, JobApplication.id == JobInterview.application_id)
+        .join(JobPosition, JobPosition.id == JobApplication.job_position_id)
+        .join(Candidate, Candidate.id == JobApplication.candidate_id)
+        .where(
+            JobPosition.company_id == company_id,
+            JobPosition.is_deleted.is_(False),
+            Candidate.is_deleted.is_(False),
+            JobInterview.interview_status == InterviewStatusEnum.NOT_SCHEDULED,
+            JobInterview.interviewer_id.is_(None),
+        )
+        .order_by(JobInterview.id)
+    )
+    if job_position_id is not None:
+        interview_query = interview_query.where(JobApplication.job_position_id == job_position_id)
+
+    interviews = db.execute(interview_query).all()
+    interviewers = db.execute(
+        select(Employee.id, Employee.public_id)
+        .where(Employee.company_id == company_id, Employee.role.in_(INTERVIEWER_ROLES))
+        .order_by(Employee.id)
+    ).all()
+    if not interviews or not interviewers:
+        return []
+
+    interviewer_ids = [row.id for row in interviewers]
+    column = {interviewer_id: i for i, interviewer_id in enumerate(interviewer_ids)}
+    competency_row = {c: i for i, c in enumerate(sorted({row.competency_id for row in interviews}))}
+    application_row = {a: i for i, a in enumerate(sorted({row.application_id for row in interviews}))}
+
+    # Per-interviewer load and recency
+    load = np.zeros(len(interviewers))
+    recency = np.zeros(len(interviewers))
+    now = datetime.now(timezone.utc)
+    for interviewer_id, active, last_at in db.execute(
+            select(
+                InterviewerStats.employee_id,
+                sum(getattr(InterviewerStats, INTERVIEW_STATUS_COLUMNS[status]) for status in LOAD_STATUSES),
+                InterviewerStats.last_interview_at,
+            )
+            .where(InterviewerStats.employee_id.in_(interviewer_ids))
+    ):
+        load[column[interviewer_id]] = active
+        if last_at is not None:
+            if last_at.tzinfo is None:
+                last_at = last_at.replace(tzinfo=timezone.utc)
+            days = max((now - last_at).total_seconds() / 86400, 0.0)
+            recency[column[interviewer_id]] = 0.5 ** (days / RECENCY_HALF_LIFE_DAYS)
+
+    # Competency x interviewer experience, scaled to [0, 1]
+    experience = np.zeros((len(competency_row), len(interviewers)))
+    for interviewer_id, competency_id, count in db.execute(
+            select(JobInterview.interviewer_id, JobInterview.competency_id, func.count())
+            .where(
+                JobInterview.interviewer_id.in_(interviewer_ids),
+                JobInterview.competency_id.in_(list(competency_row)),
+                JobInterview.interview_status.in_(EXPERIENCE_STATUSES),
+            )
+            .group_by(JobInterview.interviewer_id, JobInterview.competency_id)
+    ):
+        experience[competency_row[competency_id], column[interviewer_id]] = count
+    experience = np.log1p(experience)
+    if experience.max() > 0:
+        experience /= experience.max()
+
+    # Interviewers already holding another interview of the same application
+    application_taken = np.zeros((len(application_row), len(interviewers)), dtype=bool)
+    for application_id, interviewer_id in db.execute(
+            select(JobInterview.application_id, JobInterview.interviewer_id)
+            .where(
+                JobInterview.application_id.in_(list(application_row)),
+                JobInterview.interviewer_id.in_(interviewer_ids),
+            )
+    ):
+        application_taken[application_row[application_id], column[interviewer_id]] = True
+
+    competency_index = np.fromiter((competency_row[row.competency_id] for row in interviews), dtype=np.int64)
+    application_index = np.fromiter((application_row[row.application_id] for row in interviews), dtype=np.int64)
+    static_cost = RECENCY_WEIGHT * recency[np.newaxis, :] - EXPERIENCE_WEIGHT * experience[competency_index]
+
+    columns, costs = solve_assignment(static_cost, load, application_index, application_taken)
+
+    return [
+        ProposedAssignment(
+            interview_id=interview.id,
+            interview_public_id=interview.public_id,
+            interviewer_id=interviewers[col].id,
+            interviewer_public_id=interviewers[col].public_id,
+            cost=round(float(cost), 4),
+        )
+        for interview, col, cost in zip(interviews, columns, costs)
+    ]
+
+
+def apply_assignments(db: Session, plan: List[ProposedAssignment]) -> int:
+    """Writes the plan as one bulk UPDATE; interviews stay NOT_SCHEDULED until a time is set."""
+    if plan:
+        db.execute(update(JobInterview), [
+            {"id": assignment.interview_id, "interviewer_id": assignment.interviewer_id}
+            for assignment in plan
+        ])
+        refresh_interviewer_stats(db, {assignment.interviewer_id for assignment in plan})
+    return len(plan)
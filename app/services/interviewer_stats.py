@@ -0,0 +1,101 @@
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models import Employee, InterviewerStats, InterviewStatusEnum, JobInterview
+from app.services.job_stats import INTERVIEW_STATUS_COLUMNS
+
+UPCOMING_STATUSES = (InterviewStatusEnum.SCHEDULED, InterviewStatusEnum.RESCHEDULED)
+
+STATS_COLUMNS = (
+    "interviews_total",
+    *INTERVIEW_STATUS_COLUMNS.values(),
+    "last_interview_at",
+    "next_interview_at",
+    "updated_at",
+)
+
+
+def _empty_row(employee_id: int, now: datetime) -> dict:
+    row = {"employee_id": employee_id, "interviews_total": 0, "updated_at": now}
+    for column in INTERVIEW_STATUS_COLUMNS.values():
+        row[column] = 0
+    row["last_interview_at"] = row["next_interview_at"] = None
+    return row
+
+
+# ─── Refresh ───────────────────────────────────────────────
+def refresh_interviewer_stats(db: Session, employee_ids: Iterable[Optional[int]]) -> int:
+    """
+    Recomputes the stats rows of the given employees from their interviews
+    (read through the interviewer_id index) and upserts them. Pending ORM
+    changes must be flushed first. Returns the number of rows written.
+    """
+    employee_ids = {employee_id for employee_id in employee_ids if employee_id is not None}
+    if not employee_ids:
+        return 0
+
+    now = datetime.now(timezone.utc)
+    upcoming = and_(
+        JobInterview.interview_status.in_(UPCOMING_STATUSES),
+        JobInterview.interview_datetime > now,
+    )
+    interview_query = (
+        select(
+            JobInterview.interviewer_id,
+            JobInterview.interview_status,
+            func.count(),
+            func.max(JobInterview.interview_datetime),
+            func.min(case((upcoming, JobInterview.interview_datetime))),
+        )
+        .where(JobInterview.interviewer_id.in_(employee_ids))
+        .group_by(JobInterview.interviewer_id, JobInterview.interview_status)
+    )
+
+    rows = {employee_id: _empty_row(employee_id, now) for employee_id in employee_ids}
+    for employee_id, status, count, last_at, next_at in db.execute(interview_query):
+        row = rows[employee_id]
+        row["interviews_total"] += count
+        row[INTERVIEW_STATUS_COLUMNS[status]] = count
+        if last_at is not None and (row["last_interview_at"] is None or last_at > row["last_interview_at"]):
+            row["last_interview_at"] = last_at
+        if next_at is not None and (row["next_interview_at"] is None or next_at < row["next_interview_at"]):
+            row["next_interview_at"] = next_at
+
+    stmt = insert(InterviewerStats).values(list(rows.values()))
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[InterviewerStats.employee_id],
+        set_={column: stmt.excluded[column] for column in STATS_COLUMNS},
+    ))
+    return len(rows)
+
+
+def interviewer_ids_for(db: Session, *criteria) -> set[int]:
+    """Interviewers assigned to the interviews matching `criteria`, collected before they change."""
+    return set(db.scalars(
+        select(JobInterview.interviewer_id)
+        .where(JobInterview.interviewer_id.is_not(None), *criteria)
+        .distinct()
+    ))
+
+
+# ─── Reconcile ─────────────────────────────────────────────
+def reconcile_interviewer_stats(db: Session, chunk_size: int = 1000) -> int:
+    """
+    Refreshes every employee's row, chunk_size employees per transaction.
+    Repairs drift from concurrent writers and cascading deletes, and moves
+    next_interview_at past interviews whose time has come.
+    """
+    written, last_id = 0, 0
+    while True:
+        employee_ids = db.scalars(
+            select(Employee.id).where(Employee.id > last_id).order_by(Employee.id).limit(chunk_size)
+        ).all()
+        if not employee_ids:
+            return written
+        written += refresh_interviewer_stats(db, employee_ids)
+        db.commit()
+        last_id = employee_ids[-1]
@@ -0,0 +1,286 @@
+import uuid
+from typing import Dict, List, Sequence
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models import (
+    CompetencyRubricLevel,
+    EvaluationIndicator,
+    InterviewQuestion,
+    RubricScoreLevel,
+    TypeLabel,
+    job_position_competency_mappings,
+)
+from app.schemas.competency import CompetencyOut
+from app.schemas.rubric import Indicator, Questions, RubricLevel
+from app.services.competency_library import resolve_competencies
+
+
+# ─── Validation ────────────────────────────────────────────
+def parse_score_level(level: int) -> RubricScoreLevel:
+    try:
+        return RubricScoreLevel(level)
+    except ValueError:
+        raise ValueError(f"Invalid rubric score: {level}")
+
+
+def parse_question_type(question_type: str) -> TypeLabel:
+    try:
+        return TypeLabel[question_type.upper()]
+    except (KeyError, AttributeError):
+        raise ValueError(f"Invalid question type: {question_type}")
+
+
+def validate_blocks(blocks: Sequence[CompetencyOut]) -> None:
+    """Rejects the payload before anything is written."""
+    for block in blocks:
+        for rubric_level in block.rubric_levels:
+            parse_score_level(rubric_level.level)
+        for question in block.questions:
+            parse_question_type(question.type)
+
+
+# ─── Bulk Writes ───────────────────────────────────────────
+def resolve_competency_ids(db: Session, company_id: int, blocks: Sequence[CompetencyOut]) -> Dict[str, int]:
+    """Block name -> the company's competency id, creating missing ones in the library."""
+    return resolve_competencies(db, company_id, [(block.name, block.description) for block in blocks])
+
+
+def insert_rubric_levels(
+        db: Session,
+        job_position_id: int,
+        entries: List[tuple[int, RubricLevel]],
+) -> List[int]:
+    """Inserts (competency_id, rubric level) rows; returns their ids in entry order."""
+    if not entries:
+        return []
+
+    # Rows carry their own public_id so RETURNING can be matched back without relying on row order
+    public_ids = [uuid.uuid4() for _ in entries]
+    level_ids = dict(db.execute(
+        insert(CompetencyRubricLevel).returning(CompetencyRubricLevel.public_id, CompetencyRubricLevel.id),
+        [
+            {
+                "public_id": public_id,
+                "competency_id": competency_id,
+                "job_position_id": job_position_id,
+                "level": parse_score_level(rubric_level.level),
+                "description": rubric_level.description,
+            }
+            for public_id, (competency_id, rubric_level) in zip(public_ids, entries)
+        ],
+    ).all())
+    return [level_ids[public_id] for public_id in public_ids]
+
+
+def insert_indicators(db: Session, entries: List[tuple[int, Indicator]]) -> None:
+    if entries:
+        db.execute(insert(EvaluationIndicator), [
+            {"rubric_level_id": rubric_level_id, "indicator_text": indicator.indicator_text}
+            for rubric_level_id, indicator in entries
+        ])
+
+
+def insert_questions(
+        db: Session,
+        job_position_id: int,
+        entries: List[tuple[int, Questions]],
+) -> None:
+    if entries:
+        db.execute(insert(InterviewQuestion), [
+            {
+                "question_text": question.text,
+                "type": parse_question_type(question.type),
+                "competency_id": competency_id,
+                "job_position_id": job_position_id,
+            }
+            for competency_id, question in entries
+        ])
+
+
+def insert_job_content(
+        db: Session,
+        company_id: int,
+        job_position_id: int,
+        blocks: Sequence[CompetencyOut],
+) -> int:
+    """
+    Writes competencies, rubric levels, indicators and questions for a new
+    job in a fixed number of statements. Returns the competency count.
+    """
+    validate_blocks(blocks)
+    competency_ids = resolve_competency_ids(db, company_id, blocks)
+
+    mapped = list(dict.fromkeys(competency_ids[block.name] for block in blocks))
+    if mapped:
+        db.execute(insert(job_position_competency_mappings), [
+            {"job_position_id": job_position_id, "competency_id": competency_id}
+            for competency_id in mapped
+        ])
+
+    level_entries = [
+        (competency_ids[block.name], rubric_level)
+        for block in blocks for rubric_level in block.rubric_levels
+    ]
+    level_ids = insert_rubric_levels(db, job_position_id, level_entries)
+    insert_indicators(db, [
+        (level_id, indicator)
+        for level_id, (_, rubric_level) in zip(level_ids, level_entries)
+        for indicator in rubric_level.indicators
+    ])
+    insert_questions(db, job_position_id, [
+        (competency_ids[block.name], question)
+        for block in blocks for question in block.questions
+    ])
+    return len(mapped)
+
+
+# ─── Diff Update ───────────────────────────────────────────
+def _claim(stored: dict, claimed: set, public_id):
+    """The stored row for a payload public_id, once; repeats and unknown ids are new rows."""
+    row = stored.get(public_id)
+    if row is None or public_id in claimed:
+        return None
+    claimed.add(public_id)
+    return row
+
+
+def update_job_content(
+        db: Session,
+        company_id: int,
+        job_position_id: int,
+        blocks: Sequence[CompetencyOut],
+) -> int:
+    """
+    Brings a job's stored tree in line with the payload, touching only the
+    rows that changed. Levels, indicators and questions are matched by the
+    public_ids GET /api/job/{id} returns; anything unmatched is inserted and
+    stored rows the payload no longer mentions are deleted. Every query is
+    scoped to this job, so jobs sharing a competency are left alone.
+    Returns the competency count.
+    """
+    validate_blocks(blocks)
+    competency_ids = resolve_competency_ids(db, company_id, blocks)
+    mapping = job_position_competency_mappings.c
+
+    # Competency mappings
+    desired = list(dict.fromkeys(competency_ids[block.name] for block in blocks))
+    current = set(db.scalars(select(mapping.competency_id).where(mapping.job_position_id == job_position_id)))
+    added = [competency_id for competency_id in desired if competency_id not in current]
+    removed = current.difference(desired)
+    if added:
+        db.execute(insert(job_position_competency_mappings), [
+            {"job_position_id": job_position_id, "competency_id": competency_id}
+            for competency_id in added
+        ])
+    if removed:
+        db.execute(delete(job_position_competency_mappings).where(
+            mapping.job_position_id == job_position_id,
+            mapping.competency_id.in_(removed),
+        ))
+
+    # Stored tree
+    stored_levels = {row.public_id: row for row in db.execute(
+        select(
+            CompetencyRubricLevel.id,
+            CompetencyRubricLevel.public_id,
+            CompetencyRubricLevel.competency_id,
+            CompetencyRubricLevel.level,
+            CompetencyRubricLevel.description,
+        ).where(CompetencyRubricLevel.job_position_id == job_position_id)
+    )}
+    stored_indicators = {row.public_id: row for row in db.execute(
+        select(
+            EvaluationIndicator.id,
+            EvaluationIndicator.public_id,
+            EvaluationIndicator.rubric_level_id,
+            EvaluationIndicator.indicator_text,
+        )
+        .join(CompetencyRubricLevel, CompetencyRubricLevel.id == EvaluationIndicator.rubric_level_id)
+        .where(CompetencyRubricLevel.job_position_id == job_position_id)
+    )}
+    stored_questions = {row.public_id: row for row in db.execute(
+        select(
+            InterviewQuestion.id,
+            InterviewQuestion.public_id,
+            InterviewQuestion.competency_id,
+            InterviewQuestion.question_text,
+            InterviewQuestion.type,
+        ).where(InterviewQuestion.job_position_id == job_position_id)
+    )}
+
+    # Diff
+    claimed_levels, claimed_indicators, claimed_questions = set(), set(), set()
+    level_updates, indicator_updates, question_updates = [], [], []
+    new_levels, new_questions = [], []
+    indicators_for_existing, indicators_for_new = [], []
+
+    for block in blocks:
+        competency_id = competency_ids[block.name]
+
+        for rubric_level in block.rubric_levels:
+            values = {
+                "competency_id": competency_id,
+                "level": parse_score_level(rubric_level.level),
+                "description": rubric_level.description,
+            }
+            stored = _claim(stored_levels, claimed_levels, rubric_level.public_id)
+            if stored is None:
+                new_levels.append((competency_id, rubric_level))
+                indicators_for_new.extend(
+                    (len(new_levels) - 1, indicator) for indicator in rubric_level.indicators
+                )
+                continue
+
+            if any(getattr(stored, key) != value for key, value in values.items()):
+                level_updates.append({"id": stored.id, **values})
+
+            for indicator in rubric_level.indicators:
+                stored_indicator = _claim(stored_indicators, claimed_indicators, indicator.public_id)
+                if stored_indicator is None:
+                    indicators_for_existing.append((stored.id, indicator))
+                elif (stored_indicator.rubric_level_id, stored_indicator.indicator_text) != \
+                        (stored.id, indicator.indicator_text):
+                    indicator_updates.append({
+                        "id": stored_indicator.id,
+                        "rubric_level_id": stored.id,
+                        "indicator_text": indicator.indicator_text,
+                    })
+
+        for question in block.questions:
+            values = {
+                "competency_id": competency_id,
+                "question_text": question.text,
+                "type": parse_question_type(question.type),
+            }
+            stored = _claim(stored_questions, claimed_questions, question.public_id)
+            if stored is None:
+                new_questions.append((competency_id, question))
+            elif any(getattr(stored, key) != value for key, value in values.items()):
+                question_updates.append({"id": stored.id, **values})
+
+    # Apply: updates first so indicators moved off a stale level survive its delete
+    if level_updates:
+        db.execute(update(CompetencyRubricLevel), level_updates)
+    if indicator_updates:
+        db.execute(update(EvaluationIndicator), indicator_updates)
+    if question_updates:
+        db.execute(update(InterviewQuestion), question_updates)
+
+    stale_levels = [row.id for key, row in stored_levels.items() if key not in claimed_levels]
+    stale_indicators = [row.id for key, row in stored_indicators.items() if key not in claimed_indicators]
+    stale_questions = [row.id for key, row in stored_questions.items() if key not in claimed_questions]
+    if stale_indicators:
+        db.execute(delete(EvaluationIndicator).where(EvaluationIndicator.id.in_(stale_indicators)))
+    if stale_levels:
+        db.execute(delete(CompetencyRubricLevel).where(CompetencyRubricLevel.id.in_(stale_levels)))
+    if stale_questions:
+        db.execute(delete(InterviewQuestion).where(InterviewQuestion.id.in_(stale_questions)))
+
+    new_level_ids = insert_rubric_levels(db, job_position_id, new_levels)
+    insert_indicators(db, indicators_for_existing + [
+        (new_level_ids[index], indicator) for index, indicator in indicators_for_new
+    ])
+    insert_questions(db, job_position_id, new_questions)
+    return len(desired)
@@ -0,0 +1,73 @@
+from collections import defaultdict
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import TwoTierCache, job_tag
+from app.core.config import settings
+from app.db.loaders import loader_profile
+from app.models import JobPosition
+from app.schemas.competency import CompetencyOut
+from app.schemas.new_job import NewJobPayload
+from app.schemas.rubric import Questions, Indicator, RubricLevel
+
+# Entries are immutable: a rewrite bumps content_version and so changes the key
+_detail_cache = TwoTierCache(
+    "job-detail", maxsize=settings.JOB_DETAIL_CACHE_SIZE, ttl=settings.JOB_DETAIL_CACHE_TTL_SECONDS
+)
+
+
+def build_job_payload(job_position: JobPosition) -> NewJobPayload:
+    # Levels and questions hang off (job, competency); only this job's rows belong in the payload
+    rubric_levels_by_competency = defaultdict(list)
+    for level in sorted(job_position.competency_rubric_levels, key=lambda l: (l.level.value, l.id)):
+        rubric_levels_by_competency[level.competency_id].append(
+            RubricLevel(
+                public_id=level.public_id,
+                level=level.level.value,
+                description=level.description,
+                indicators=[
+                    Indicator(
+                        public_id=i.public_id,
+                        indicator_text=i.indicator_text
+                    )
+                    for i in sorted(level.indicators, key=lambda i: i.id)
+                ]
+            )
+        )
+
+    questions_by_competency = defaultdict(list)
+    for q in sorted(job_position.interview_questions, key=lambda q: q.id):
+        questions_by_competency[q.competency_id].append(Questions.model_validate(q))
+
+    return NewJobPayload(
+        title=job_position.title,
+        description=job_position.description,
+        competencies=[
+            CompetencyOut(
+                public_id=competency.public_id,
+                name=competency.name,
+                description=competency.description,
+                rubric_levels=rubric_levels_by_competency[competency.id],
+                questions=questions_by_competency[competency.id]
+            )
+            for competency in job_position.competencies
+        ],
+    )
+
+
+async def job_detail_bytes(db: AsyncSession, job_position_id: int, public_id: UUID, version: int) -> bytes:
+    """
+    JSON-encoded NewJobPayload for the job, served from the two-tier cache and
+    only built from the rubric tree when neither tier has this version.
+    """
+    async def build() -> bytes:
+        job_position = await db.scalar(
+            select(JobPosition)
+            .where(JobPosition.id == job_position_id)
+            .options(*loader_profile("job.detail"))
+        )
+        return build_job_payload(job_position).model_dump_json(by_alias=True).encode()
+
+    return await _detail_cache.get_or_set(f"{public_id}:{version}", build, tags=[job_tag(public_id)])
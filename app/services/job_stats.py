@@ -0,0 +1,179 @@
+from collections import defaultdict
+from typing import Iterable, Mapping, Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Candidate,
+    JobApplication,
+    JobApplicationStatus,
+    JobInterview,
+    InterviewStatusEnum,
+    JobPosition,
+    JobPositionStats,
+    job_position_competency_mappings,
+)
+
+APPLICATION_STATUS_COLUMNS = {
+    JobApplicationStatus.PENDING: "applications_pending",
+    JobApplicationStatus.HIRE: "applications_hire",
+    JobApplicationStatus.REJECT: "applications_reject",
+}
+
+INTERVIEW_STATUS_COLUMNS = {
+    InterviewStatusEnum.NOT_SCHEDULED: "interviews_not_scheduled",
+    InterviewStatusEnum.SCHEDULED: "interviews_scheduled",
+    InterviewStatusEnum.RESCHEDULED: "interviews_rescheduled",
+    InterviewStatusEnum.CANCELLED: "interviews_cancelled",
+    InterviewStatusEnum.COMPLETED: "interviews_completed",
+    InterviewStatusEnum.NO_SHOW: "interviews_no_show",
+    InterviewStatusEnum.FEEDBACK_PENDING: "interviews_feedback_pending",
+}
+
+
+# ─── Incremental Maintenance ───────────────────────────────
+def create_job_stats(db: Session, job_position_id: int, competency_count: int = 0) -> None:
+    db.execute(insert(JobPositionStats).values(
+        job_position_id=job_position_id,
+        competency_count=competency_count,
+    ))
+
+
+def _apply(db: Session, job_position_id: int, deltas: Mapping[str, int]) -> None:
+    values = {
+        column: getattr(JobPositionStats, column) + delta
+        for column, delta in deltas.items() if delta
+    }
+    if values:
+        db.execute(
+            update(JobPositionStats)
+            .where(JobPositionStats.job_position_id == job_position_id)
+            .values(values)
+        )
+
+
+def record_applications(
+        db: Session,
+        job_position_id: int,
+        status: JobApplicationStatus,
+        delta: int,
+        interview_deltas: Optional[Mapping[InterviewStatusEnum, int]] = None,
+) -> None:
+    deltas = {
+        "applications_total": delta,
+        APPLICATION_STATUS_COLUMNS[JobApplicationStatus(status)]: delta,
+    }
+    for interview_status, interview_delta in (interview_deltas or {}).items():
+        deltas[INTERVIEW_STATUS_COLUMNS[InterviewStatusEnum(interview_status)]] = interview_delta
+    _apply(db, job_position_id, deltas)
+
+
+def record_interviews(
+        db: Session,
+        job_position_id: int,
+        deltas: Mapping[InterviewStatusEnum, int],
+) -> None:
+    column_deltas = defaultdict(int)
+    for status, delta in deltas.items():
+        column_deltas[INTERVIEW_STATUS_COLUMNS[InterviewStatusEnum(status)]] += delta
+    _apply(db, job_position_id, column_deltas)
+
+
+def record_interview_status_change(
+        db: Session,
+        job_position_id: int,
+        old_status: InterviewStatusEnum,
+        new_status: InterviewStatusEnum,
+) -> None:
+    if old_status != new_status:
+        record_interviews(db, job_position_id, {old_status: -1, new_status: 1})
+
+
+def set_competency_count(db: Session, job_position_id: int, competency_count: int) -> None:
+    db.execute(
+        update(JobPositionStats)
+        .where(JobPositionStats.job_position_id == job_position_id)
+        .values(competency_count=competency_count)
+    )
+
+
+def subtract_candidate(db: Session, candidate_id: int) -> None:
+    """Takes a candidate's applications and interviews out of their jobs' counters (before a soft delete)."""
+    job_deltas = defaultdict(lambda: defaultdict(int))
+    for job_id, status, count in db.execute(
+            select(JobApplication.job_position_id, JobApplication.status, func.count())
+            .where(JobApplication.candidate_id == candidate_id)
+            .group_by(JobApplication.job_position_id, JobApplication.status)
+    ):
+        job_deltas[job_id]["applications_total"] -= count
+        job_deltas[job_id][APPLICATION_STATUS_COLUMNS[status]] -= count
+
+    for job_id, status, count in db.execute(
+            select(JobApplication.job_position_id, JobInterview.interview_status, func.count())
+            .join(JobInterview, JobInterview.application_id == JobApplication.id)
+            .where(JobApplication.candidate_id == candidate_id)
+            .group_by(JobApplication.job_position_id, JobInterview.interview_status)
+    ):
+        job_deltas[job_id][INTERVIEW_STATUS_COLUMNS[status]] -= count
+
+    for job_id, deltas in job_deltas.items():
+        _apply(db, job_id, deltas)
+
+
+# ─── Rebuild ───────────────────────────────────────────────
+def _empty_row(job_position_id: int) -> dict:
+    row = {"job_position_id": job_position_id, "competency_count": 0, "applications_total": 0}
+    for column in (*APPLICATION_STATUS_COLUMNS.values(), *INTERVIEW_STATUS_COLUMNS.values()):
+        row[column] = 0
+    return row
+
+
+def rebuild_job_stats(db: Session, job_position_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    Recomputes stats rows from the source tables, leaving out soft-deleted
+    candidates. Returns the number of rows written.
+    """
+    mapping = job_position_competency_mappings.c
+
+    job_query = select(JobPosition.id)
+    competency_query = select(mapping.job_position_id, func.count()).group_by(mapping.job_position_id)
+    application_query = (
+        select(JobApplication.job_position_id, JobApplication.status, func.count())
+        .join(Candidate, Candidate.id == JobApplication.candidate_id)
+        .where(Candidate.is_deleted.is_(False))
+        .group_by(JobApplication.job_position_id, JobApplication.status)
+    )
+    interview_query = (
+        select(JobApplication.job_position_id, JobInterview.interview_status, func.count())
+        .join(JobInterview, JobInterview.application_id == JobApplication.id)
+        .join(Candidate, Candidate.id == JobApplication.candidate_id)
+        .where(Candidate.is_deleted.is_(False))
+        .group_by(JobApplication.job_position_id, JobInterview.interview_status)
+    )
+    clear_query = delete(JobPositionStats)
+
+    if job_position_ids is not None:
+        job_position_ids = list(job_position_ids)
+        job_query = job_query.where(JobPosition.id.in_(job_position_ids))
+        competency_query = competency_query.where(mapping.job_position_id.in_(job_position_ids))
+        application_query = application_query.where(JobApplication.job_position_id.in_(job_position_ids))
+        interview_query = interview_query.where(JobApplication.job_position_id.in_(job_position_ids))
+        clear_query = clear_query.where(JobPositionStats.job_position_id.in_(job_position_ids))
+
+    rows = {job_id: _empty_row(job_id) for job_id in db.scalars(job_query)}
+
+    for job_id, count in db.execute(competency_query):
+        rows[job_id]["competency_count"] = count
+
+    for job_id, status, count in db.execute(application_query):
+        rows[job_id]["applications_total"] += count
+        rows[job_id][APPLICATION_STATUS_COLUMNS[status]] = count
+
+    for job_id, status, count in db.execute(interview_query):
+        rows[job_id][INTERVIEW_STATUS_COLUMNS[status]] = count
+
+    db.execute(clear_query)
+    if rows:
+        db.execute(insert(JobPositionStats), list(rows.values()))
+    return len(rows)
@@ -0,0 +1,135 @@
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models import (
+    Candidate,
+    CompetencyRubricLevel,
+    EvaluationIndicator,
+    InterviewQuestion,
+    JobApplication,
+    JobInterview,
+    JobPosition,
+)
+from app.services.interviewer_stats import interviewer_ids_for, refresh_interviewer_stats
+from app.services.job_stats import rebuild_job_stats, subtract_candidate
+
+
+# ─── Soft Delete ───────────────────────────────────────────
+def soft_delete_job_position(db: Session, job_position_id: int) -> None:
+    db.execute(update(JobPosition).where(JobPosition.id == job_position_id).values(is_deleted=True))
+
+
+def soft_delete_candidate(db: Session, candidate_id: int) -> None:
+    # Counters drop now, in the request's transaction, rather than when the purge gets to it
+    subtract_candidate(db, candidate_id)
+    db.execute(update(Candidate).where(Candidate.id == candidate_id).values(is_deleted=True))
+
+
+def application_count(db: Session, **filters) -> int:
+    return db.scalar(select(func.count()).select_from(JobApplication).filter_by(**filters))
+
+
+def needs_background_delete(db: Session, **filters) -> bool:
+    return application_count(db, **filters) > settings.BACKGROUND_DELETE_THRESHOLD
+
+
+# ─── Immediate Delete ──────────────────────────────────────
+def delete_job_position(db: Session, job_position_id: int) -> None:
+    """One DELETE; the database cascades to the whole subtree. Interviewer stats are refreshed after."""
+    applications = select(JobApplication.id).where(JobApplication.job_position_id == job_position_id)
+    interviewer_ids = interviewer_ids_for(db, JobInterview.application_id.in_(applications))
+    db.execute(delete(JobPosition).where(JobPosition.id == job_position_id))
+    refresh_interviewer_stats(db, interviewer_ids)
+
+
+def delete_candidate(db: Session, candidate_id: int) -> None:
+    """One DELETE cascading to applications and interviews, then a stats rebuild for the touched jobs and interviewers."""
+    job_position_ids = set(db.scalars(
+        select(JobApplication.job_position_id).where(JobApplication.candidate_id == candidate_id)
+    ))
+    applications = select(JobApplication.id).where(JobApplication.candidate_id == candidate_id)
+    interviewer_ids = interviewer_ids_for(db, JobInterview.application_id.in_(applications))
+    db.execute(delete(Candidate).where(Candidate.id == candidate_id))
+    if job_position_ids:
+        rebuild_job_stats(db, job_position_ids)
+    refresh_interviewer_stats(db, interviewer_ids)
+
+
+# ─── Chunked Purge ─────────────────────────────────────────
+def _on_behalf_of(db: Session, company_id) -> None:
+    # Purges run outside any request: the session still has to bump the
+    # company's change counter and invalidate its cache tag on every commit
+    if company_id is not None:
+        db.info["company_id"] = company_id
+
+
+def _delete_in_chunks(db: Session, model, *criteria) -> int:
+    """Deletes matching rows DELETE_CHUNK_SIZE at a time, committing each chunk."""
+    deleted = 0
+    while True:
+        ids = db.scalars(select(model.id).where(*criteria).limit(settings.DELETE_CHUNK_SIZE)).all()
+        if not ids:
+            return deleted
+        db.execute(delete(model).where(model.id.in_(ids)))
+        db.commit()
+        deleted += len(ids)
+
+
+def purge_job_position(db: Session, job_position_id: int) -> None:
+    """
+    Removes a soft-deleted job bottom-up in bounded transactions, then the
+    job row itself (mappings and stats go with it through ON DELETE CASCADE).
+    """
+    applications = select(JobApplication.id).where(JobApplication.job_position_id == job_position_id)
+    levels = select(CompetencyRubricLevel.id).where(CompetencyRubricLevel.job_position_id == job_position_id)
+    _on_behalf_of(db, db.scalar(select(JobPosition.company_id).where(JobPosition.id == job_position_id)))
+
+    interviewer_ids = interviewer_ids_for(db, JobInterview.application_id.in_(applications))
+    _delete_in_chunks(db, JobInterview, JobInterview.application_id.in_(applications))
+    _delete_in_chunks(db, JobApplication, JobApplication.job_position_id == job_position_id)
+    _delete_in_chunks(db, EvaluationIndicator, EvaluationIndicator.rubric_level_id.in_(levels))
+    _delete_in_chunks(db, CompetencyRubricLevel, CompetencyRubricLevel.job_position_id == job_position_id)
+    _delete_in_chunks(db, InterviewQuestion, InterviewQuestion.job_position_id == job_position_id)
+
+    delete_job_position(db, job_position_id)
+    refresh_interviewer_stats(db, interviewer_ids)
+    db.commit()
+
+
+def purge_candidate(db: Session, candidate_id: int) -> None:
+    """Removes a soft-deleted candidate's interviews and applications in chunks, then the candidate."""
+    applications = select(JobApplication.id).where(JobApplication.candidate_id == candidate_id)
+    _on_behalf_of(db, db.scalar(
+        select(JobPosition.company_id)
+        .join(JobApplication, JobApplication.job_position_id == JobPosition.id)
+        .where(JobApplication.candidate_id == candidate_id)
+        .limit(1)
+    ))
+    interviewer_ids = interviewer_ids_for(db, JobInterview.application_id.in_(applications))
+    _delete_in_chunks(db, JobInterview, JobInterview.application_id.in_(applications))
+
+    # Applications go with the candidate so delete_candidate still sees the touched jobs
+    delete_candidate(db, candidate_id)
+    refresh_interviewer_stats(db, interviewer_ids)
+    db.commit()
+
+
+def run_purge(purge, target_id: int) -> None:
+    """BackgroundTasks entry point: purges outside the request's session."""
+    with SessionLocal() as db:
+        purge(db, target_id)
+
+
+def purge_soft_deleted(db: Session) -> tuple[int, int]:
+    """Finishes purges interrupted by a restart. Returns (jobs, candidates) purged."""
+    job_position_ids = db.scalars(select(JobPosition.id).where(JobPosition.is_deleted.is_(True))).all()
+    for job_position_id in job_position_ids:
+        purge_job_position(db, job_position_id)
+
+    candidate_ids = db.scalars(select(Candidate.id).where(Candidate.is_deleted.is_(True))).all()
+    for candidate_id in candidate_ids:
+        purge_candidate(db, candidate_id)
+
+    return len(job_position_ids), len(candidate_ids)
@@ -0,0 +1,51 @@
+import re
+from typing import Optional, Sequence
+
+from sqlalchemy import func, literal_column, or_
+
+from app.models import Candidate, JobPosition
+from app.models.recruitment.candidate import candidate_search_document
+
+# ─── Trigram ───────────────────────────────────────────────
+# Expressions backed by pg_trgm GIN indexes (see the models' __table_args__)
+CANDIDATE_SEARCH_COLUMNS = (Candidate.full_name, func.lower(Candidate.email))
+JOB_TITLE_SEARCH_COLUMNS = (func.lower(JobPosition.title),)
+
+
+def normalize_search(term: str) -> str:
+    return " ".join(term.lower().split())
+
+
+def trigram_filter(columns: Sequence, term: str):
+    """Substring match on lower-cased columns; served by gin_trgm_ops indexes."""
+    term = normalize_search(term)
+    return or_(*[column.contains(term, autoescape=True) for column in columns])
+
+
+def trigram_rank(columns: Sequence, term: str):
+    """Best word_similarity of the term against any of the columns, for relevance ordering."""
+    term = normalize_search(term)
+    return func.greatest(*[func.word_similarity(term, column) for column in columns])
+
+
+# ─── Full-Text ─────────────────────────────────────────────
+CANDIDATE_DOCUMENT = candidate_search_document(Candidate.__table__)
+
+_TOKEN_RE = re.compile(r"[\w@.+-]+")
+
+
+def prefix_tsquery(term: str) -> Optional[str]:
+    """'jane do' -> 'jane:* & do:*'; None when the term has no searchable tokens."""
+    tokens = [token.strip(".+-") for token in _TOKEN_RE.findall(term.lower())]
+    tokens = [token for token in tokens if token]
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def fulltext_match(document, tsquery: str):
+    return document.op("@@")(func.to_tsquery(literal_column("'simple'::regconfig"), tsquery))
+
+
+def fulltext_rank(document, tsquery: str):
+    return func.ts_rank(document, func.to_tsquery(literal_column("'simple'::regconfig"), tsquery))
@@ -0,0 +1,28 @@
+"""adding employee token version
+
+Revision ID: 0c7b5e9a4d16
+Revises: f61d0a3c8e47
+Create Date: 2026-10-17 23:05:41.917302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c7b5e9a4d16'
+down_revision: Union[str, None] = 'f61d0a3c8e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('employees', sa.Column('token_version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('employees', 'token_version')
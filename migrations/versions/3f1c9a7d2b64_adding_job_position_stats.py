@@ -0,0 +1,99 @@
+"""adding job_position_stats
+
+Revision ID: 3f1c9a7d2b64
+Revises: 66d2d3072bf8
+Create Date: 2026-10-17 09:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b64'
+down_revision: Union[str, None] = '66d2d3072bf8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTER_COLUMNS = [
+    'competency_count',
+    'applications_total',
+    'applications_pending',
+    'applications_hire',
+    'applications_reject',
+    'interviews_not_scheduled',
+    'interviews_scheduled',
+    'interviews_rescheduled',
+    'interviews_cancelled',
+    'interviews_completed',
+    'interviews_no_show',
+    'interviews_feedback_pending',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'job_position_stats',
+        sa.Column('job_position_id', sa.Integer(), nullable=False),
+        *[
+            sa.Column(name, sa.Integer(), server_default=sa.text('0'), nullable=False)
+            for name in COUNTER_COLUMNS
+        ],
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(['job_position_id'], ['job_positions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('job_position_id'),
+    )
+
+    # Backfill from the source tables
+    op.execute("""
+        INSERT INTO job_position_stats (
+            job_position_id, competency_count,
+            applications_total, applications_pending, applications_hire, applications_reject,
+            interviews_not_scheduled, interviews_scheduled, interviews_rescheduled,
+            interviews_cancelled, interviews_completed, interviews_no_show,
+            interviews_feedback_pending
+        )
+        SELECT
+            jp.id,
+            COALESCE(c.competency_count, 0),
+            COALESCE(a.total, 0), COALESCE(a.pending, 0), COALESCE(a.hire, 0), COALESCE(a.reject, 0),
+            COALESCE(i.not_scheduled, 0), COALESCE(i.scheduled, 0), COALESCE(i.rescheduled, 0),
+            COALESCE(i.cancelled, 0), COALESCE(i.completed, 0), COALESCE(i.no_show, 0),
+            COALESCE(i.feedback_pending, 0)
+        FROM job_positions jp
+        LEFT JOIN (
+            SELECT job_position_id, COUNT(*) AS competency_count
+            FROM job_position_competency_mappings
+            GROUP BY job_position_id
+        ) c ON c.job_position_id = jp.id
+        LEFT JOIN (
+            SELECT job_position_id,
+                   COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE status = 'PENDING') AS pending,
+                   COUNT(*) FILTER (WHERE status = 'HIRE') AS hire,
+                   COUNT(*) FILTER (WHERE status = 'REJECT') AS reject
+            FROM job_applications
+            GROUP BY job_position_id
+        ) a ON a.job_position_id = jp.id
+        LEFT JOIN (
+            SELECT ja.job_position_id,
+                   COUNT(*) FILTER (WHERE ji.interview_status = 'NOT_SCHEDULED') AS not_scheduled,
+                   COUNT(*) FILTER (WHERE ji.interview_status = 'SCHEDULED') AS scheduled,
+                   COUNT(*) FILTER (WHERE ji.interview_status = 'RESCHEDULED') AS rescheduled,
+                   COUNT(*) FILTER (WHERE ji.interview_status = 'CANCELLED') AS cancelled,
+                   COUNT(*) FILTER (WHERE ji.interview_status = 'COMPLETED') AS completed,
+                   COUNT(*) FILTER (WHERE ji.interview_status = 'NO_SHOW') AS no_show,
+                   COUNT(*) FILTER (WHERE ji.interview_status = 'FEEDBACK_PENDING') AS feedback_pending
+            FROM job_interviews ji
+            JOIN job_applications ja ON ja.id = ji.application_id
+            GROUP BY ja.job_position_id
+        ) i ON i.job_position_id = jp.id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_position_stats')
@@ -0,0 +1,30 @@
+"""indexing evaluation_indicators.rubric_level_id
+
+Revision ID: 5d8a3b6e9c21
+Revises: c47d9e12b3f8
+Create Date: 2026-10-17 15:21:44.918302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8a3b6e9c21'
+down_revision: Union[str, None] = 'c47d9e12b3f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f('ix_evaluation_indicators_rubric_level_id'), 'evaluation_indicators', ['rubric_level_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_evaluation_indicators_rubric_level_id'), table_name='evaluation_indicators')
@@ -0,0 +1,49 @@
+"""adding trigram search indexes
+
+Revision ID: 8e2b5c4f1a90
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-17 11:40:08.215374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e2b5c4f1a90'
+down_revision: Union[str, None] = '3f1c9a7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('candidates', sa.Column(
+        'full_name',
+        sa.String(),
+        sa.Computed("lower(coalesce(first_name, '') || ' ' || coalesce(last_name, ''))", persisted=True),
+        nullable=True,
+    ))
+    op.create_index(
+        'ix_candidates_full_name_trgm', 'candidates', ['full_name'],
+        unique=False, postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_candidates_email_trgm', 'candidates', [sa.text('lower(email) gin_trgm_ops')],
+        unique=False, postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_job_positions_title_trgm', 'job_positions', [sa.text('lower(title) gin_trgm_ops')],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_positions_title_trgm', table_name='job_positions')
+    op.drop_index('ix_candidates_email_trgm', table_name='candidates')
+    op.drop_index('ix_candidates_full_name_trgm', table_name='candidates')
+    op.drop_column('candidates', 'full_name')
@@ -0,0 +1,32 @@
+"""adding soft delete to jobs and candidates
+
+Revision ID: 9b1e7c4d2a58
+Revises: 5d8a3b6e9c21
+Create Date: 2026-10-17 16:48:10.337205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b1e7c4d2a58'
+down_revision: Union[str, None] = '5d8a3b6e9c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('job_positions', 'candidates'):
+        op.add_column(table, sa.Column('is_deleted', sa.Boolean(), server_default=sa.text('false'), nullable=False))
+        op.create_index(op.f(f'ix_{table}_is_deleted'), table, ['is_deleted'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('candidates', 'job_positions'):
+        op.drop_index(op.f(f'ix_{table}_is_deleted'), table_name=table)
+        op.drop_column(table, 'is_deleted')
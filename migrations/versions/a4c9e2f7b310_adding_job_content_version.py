@@ -0,0 +1,28 @@
+"""adding job content version
+
+Revision ID: a4c9e2f7b310
+Revises: e3a6f0b8c715
+Create Date: 2026-10-17 19:14:02.581930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c9e2f7b310'
+down_revision: Union[str, None] = 'e3a6f0b8c715'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_positions', sa.Column('content_version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('job_positions', 'content_version')
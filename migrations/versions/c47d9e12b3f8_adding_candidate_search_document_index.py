@@ -0,0 +1,35 @@
+"""adding candidate search document index
+
+Revision ID: c47d9e12b3f8
+Revises: 8e2b5c4f1a90
+Create Date: 2026-10-17 13:05:52.640913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47d9e12b3f8'
+down_revision: Union[str, None] = '8e2b5c4f1a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_candidates_search_document', 'candidates',
+        [sa.text(
+            "to_tsvector('simple'::regconfig, coalesce(first_name, '') || ' ' "
+            "|| coalesce(last_name, '') || ' ' || coalesce(email, ''))"
+        )],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_candidates_search_document', table_name='candidates')
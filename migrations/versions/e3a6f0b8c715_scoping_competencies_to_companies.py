@@ -0,0 +1,87 @@
+"""scoping competencies to companies
+
+Revision ID: e3a6f0b8c715
+Revises: 9b1e7c4d2a58
+Create Date: 2026-10-17 18:02:37.771540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a6f0b8c715'
+down_revision: Union[str, None] = '9b1e7c4d2a58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REFERENCING_TABLES = ['competency_rubric_levels', 'interview_questions', 'job_interviews']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('competencies', sa.Column('normalized_name', sa.String(length=255), nullable=True))
+    op.add_column('competencies', sa.Column('company_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'competencies_company_id_fkey', 'competencies', 'companies', ['company_id'], ['id'], ondelete='CASCADE'
+    )
+    op.create_index(op.f('ix_competencies_company_id'), 'competencies', ['company_id'], unique=False)
+
+    op.execute("""
+        UPDATE competencies
+        SET normalized_name = lower(regexp_replace(btrim(name), '\\s+', ' ', 'g'))
+    """)
+    op.alter_column('competencies', 'normalized_name', nullable=False)
+
+    # Competencies used by a single company become that company's; shared ones stay global
+    op.execute("""
+        UPDATE competencies c
+        SET company_id = owners.company_id
+        FROM (
+            SELECT m.competency_id, min(jp.company_id) AS company_id
+            FROM job_position_competency_mappings m
+            JOIN job_positions jp ON jp.id = m.job_position_id
+            GROUP BY m.competency_id
+            HAVING count(DISTINCT jp.company_id) = 1
+        ) owners
+        WHERE owners.competency_id = c.id
+    """)
+
+    # Merge same-name competencies within a company into the oldest one
+    op.execute("""
+        CREATE TEMPORARY TABLE competency_merges ON COMMIT DROP AS
+        SELECT id, keep_id FROM (
+            SELECT id, min(id) OVER (PARTITION BY company_id, normalized_name) AS keep_id
+            FROM competencies
+            WHERE company_id IS NOT NULL
+        ) ranked
+        WHERE id <> keep_id
+    """)
+    for table in REFERENCING_TABLES:
+        op.execute(f"""
+            UPDATE {table} t SET competency_id = merges.keep_id
+            FROM competency_merges merges WHERE t.competency_id = merges.id
+        """)
+    op.execute("""
+        INSERT INTO job_position_competency_mappings (job_position_id, competency_id)
+        SELECT m.job_position_id, merges.keep_id
+        FROM job_position_competency_mappings m
+        JOIN competency_merges merges ON merges.id = m.competency_id
+        ON CONFLICT DO NOTHING
+    """)
+    op.execute("DELETE FROM competencies WHERE id IN (SELECT id FROM competency_merges)")
+
+    op.create_unique_constraint(
+        'uq_competencies_company_normalized_name', 'competencies', ['company_id', 'normalized_name']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_competencies_company_normalized_name', 'competencies', type_='unique')
+    op.drop_index(op.f('ix_competencies_company_id'), table_name='competencies')
+    op.drop_constraint('competencies_company_id_fkey', 'competencies', type_='foreignkey')
+    op.drop_column('competencies', 'company_id')
+    op.drop_column('competencies', 'normalized_name')
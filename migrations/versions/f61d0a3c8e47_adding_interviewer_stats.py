@@ -0,0 +1,78 @@
+"""adding interviewer_stats
+
+Revision ID: f61d0a3c8e47
+Revises: a4c9e2f7b310
+Create Date: 2026-10-17 21:36:18.204771
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f61d0a3c8e47'
+down_revision: Union[str, None] = 'a4c9e2f7b310'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTER_COLUMNS = [
+    'interviews_total',
+    'interviews_not_scheduled',
+    'interviews_scheduled',
+    'interviews_rescheduled',
+    'interviews_cancelled',
+    'interviews_completed',
+    'interviews_no_show',
+    'interviews_feedback_pending',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'interviewer_stats',
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        *[
+            sa.Column(name, sa.Integer(), server_default=sa.text('0'), nullable=False)
+            for name in COUNTER_COLUMNS
+        ],
+        sa.Column('last_interview_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('next_interview_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('employee_id'),
+    )
+
+    # Backfill from job_interviews; employees without interviews get their row on first refresh
+    op.execute("""
+        INSERT INTO interviewer_stats (
+            employee_id, interviews_total,
+            interviews_not_scheduled, interviews_scheduled, interviews_rescheduled,
+            interviews_cancelled, interviews_completed, interviews_no_show,
+            interviews_feedback_pending, last_interview_at, next_interview_at
+        )
+        SELECT
+            interviewer_id,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE interview_status = 'NOT_SCHEDULED'),
+            COUNT(*) FILTER (WHERE interview_status = 'SCHEDULED'),
+            COUNT(*) FILTER (WHERE interview_status = 'RESCHEDULED'),
+            COUNT(*) FILTER (WHERE interview_status = 'CANCELLED'),
+            COUNT(*) FILTER (WHERE interview_status = 'COMPLETED'),
+            COUNT(*) FILTER (WHERE interview_status = 'NO_SHOW'),
+            COUNT(*) FILTER (WHERE interview_status = 'FEEDBACK_PENDING'),
+            MAX(interview_datetime),
+            MIN(interview_datetime) FILTER (
+                WHERE interview_status IN ('SCHEDULED', 'RESCHEDULED') AND interview_datetime > now()
+            )
+        FROM job_interviews
+        WHERE interviewer_id IS NOT NULL
+        GROUP BY interviewer_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('interviewer_stats')
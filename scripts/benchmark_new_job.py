@@ -0,0 +1,92 @@
+"""Count the statements and time the bulk job-content write used by new_job.
+
+Runs inside a transaction that is rolled back, so it is safe against any
+database the app can reach.
+
+Usage: PYTHONPATH=. python scripts/benchmark_new_job.py [competencies] [levels] [indicators] [questions]
+"""
+import sys
+import time
+import uuid
+
+from sqlalchemy import event
+
+from app.db.session import SessionLocal, engine
+from app.models import Company, JobPosition, JobType
+from app.schemas.competency import CompetencyOut
+from app.services.job_content import insert_job_content
+from app.services.job_stats import create_job_stats
+
+
+def build_blocks(competencies: int, levels: int, indicators: int, questions: int) -> list[CompetencyOut]:
+    placeholder = str(uuid.UUID(int=0))
+    run = uuid.uuid4().hex[:8]
+    return [
+        CompetencyOut(
+            competency_name=f"bench-{run}-{c}",
+            competency_public_id=None,
+            description="benchmark competency",
+            rubric_levels=[
+                {
+                    "rubric_level_public_id": placeholder,
+                    "level": level,
+                    "description": f"level {level}",
+                    "indicators": [
+                        {"evaluation_indicator_public_id": placeholder, "indicator_text": f"indicator {i}"}
+                        for i in range(indicators)
+                    ],
+                }
+                for level in range(1, levels + 1)
+            ],
+            questions=[
+                {"interview_question_public_id": placeholder, "question_text": f"question {q}", "type": "technical"}
+                for q in range(questions)
+            ],
+        )
+        for c in range(competencies)
+    ]
+
+
+def main(argv: list[str]) -> None:
+    competencies, levels, indicators, questions = ([int(arg) for arg in argv] + [15, 5, 6, 3][len(argv):])[:4]
+    blocks = build_blocks(competencies, levels, indicators, questions)
+
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    db = SessionLocal()
+    try:
+        company = Company(name=f"benchmark-{uuid.uuid4().hex[:8]}")
+        db.add(company)
+        db.flush()
+
+        event.listen(engine, "before_cursor_execute", count)
+        started = time.perf_counter()
+
+        job = JobPosition(
+            title="benchmark", description="", company_id=company.id,
+            job_type=JobType.EXTERNAL, competencies=[],
+        )
+        db.add(job)
+        db.flush()
+        competency_count = insert_job_content(db, company.id, job.id, blocks)
+        create_job_stats(db, job.id, competency_count=competency_count)
+
+        elapsed = time.perf_counter() - started
+        event.remove(engine, "before_cursor_execute", count)
+    finally:
+        db.rollback()
+        db.close()
+
+    rows = competencies * (1 + levels * (1 + indicators) + questions)
+    print(
+        f"{competencies} competencies x {levels} levels x {indicators} indicators, {questions} questions: "
+        f"{rows} rows in {statements} statements, {elapsed * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,21 @@
+"""Finish purging soft-deleted jobs and candidates (e.g. after a restart cut a background purge short).
+
+Usage: PYTHONPATH=. python scripts/purge_deleted.py
+"""
+from app.db import hooks  # purges bump change counters and cache tags on commit
+from app.db.session import SessionLocal
+from app.services.purge import purge_soft_deleted
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        jobs, candidates = purge_soft_deleted(db)
+    finally:
+        db.close()
+
+    print(f"Purged {jobs} job position(s) and {candidates} candidate(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""Recompute job_position_stats from the source tables.
+
+Usage: PYTHONPATH=. python scripts/rebuild_job_stats.py [job_position_id ...]
+"""
+import sys
+
+from app.db.session import SessionLocal
+from app.services.job_stats import rebuild_job_stats
+
+
+def main(argv: list[str]) -> None:
+    job_position_ids = [int(arg) for arg in argv] or None
+
+    db = SessionLocal()
+    try:
+        written = rebuild_job_stats(db, job_position_ids)
+        db.commit()
+    finally:
+        db.close()
+
+    print(f"Rebuilt stats for {written} job position(s)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,34 @@
+"""Recompute interviewer_stats from job_interviews, once or periodically.
+
+Usage: PYTHONPATH=. python scripts/reconcile_interviewer_stats.py [--every SECONDS]
+"""
+import argparse
+import time
+
+from app.db.session import SessionLocal
+from app.services.interviewer_stats import reconcile_interviewer_stats
+
+
+def reconcile() -> None:
+    db = SessionLocal()
+    try:
+        written = reconcile_interviewer_stats(db)
+    finally:
+        db.close()
+
+    print(f"Reconciled stats for {written} employee(s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--every", type=float, help="keep running, reconciling every SECONDS")
+    args = parser.parse_args()
+
+    reconcile()
+    while args.every:
+        time.sleep(args.every)
+        reconcile()
+
+
+if __name__ == "__main__":
+    main()
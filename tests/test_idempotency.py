@@ -0,0 +1,40 @@
+import unittest
+
+from app.core.idempotency import _Fingerprint
+
+SCOPE = {"method": "POST", "path": "/api/recruiter/job/new-candidate", "query_string": b""}
+
+
+def multipart(boundary: str, fields: dict) -> bytes:
+    parts = [
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+        for name, value in fields.items()
+    ]
+    return ("".join(parts) + f"--{boundary}--\r\n").encode()
+
+
+def fingerprint(boundary: str, body: bytes, chunk_size: int) -> str:
+    fp = _Fingerprint(SCOPE, f"multipart/form-data; boundary={boundary}")
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+    for i, chunk in enumerate(chunks):
+        fp.feed({"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1})
+    return fp._hash.hexdigest()
+
+
+class FingerprintTest(unittest.TestCase):
+    fields = {"first_name": "Ada", "email": "ada@example.com"}
+
+    def test_multipart_retry_with_new_boundary_matches(self):
+        first = fingerprint("aaaa1111", multipart("aaaa1111", self.fields), chunk_size=1000)
+        # Small chunks split the delimiter across messages
+        retry = fingerprint("bbbb2222", multipart("bbbb2222", self.fields), chunk_size=7)
+        self.assertEqual(first, retry)
+
+    def test_multipart_different_fields_differ(self):
+        first = fingerprint("aaaa1111", multipart("aaaa1111", self.fields), chunk_size=1000)
+        other = fingerprint("aaaa1111", multipart("aaaa1111", {**self.fields, "email": "x@y.z"}), chunk_size=1000)
+        self.assertNotEqual(first, other)
+
+
+if __name__ == "__main__":
+    unittest.main()
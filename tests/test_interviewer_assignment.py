@@ -0,0 +1,31 @@
+import unittest
+
+import numpy as np
+
+from app.services.interviewer_assignment import level_quotas, solve_assignment
+
+
+class SolveAssignmentTest(unittest.TestCase):
+    def solve(self, load: list[int], n: int) -> np.ndarray:
+        m = len(load)
+        columns, _ = solve_assignment(
+            np.zeros((n, m)), np.array(load, dtype=float), np.arange(n), np.zeros((n, m), dtype=bool)
+        )
+        return np.bincount(columns, minlength=m)
+
+    def test_skewed_load_goes_to_idle_interviewers(self):
+        counts = self.solve([0] * 10 + [50] * 10, n=200)
+        self.assertEqual(counts.tolist(), [20] * 10 + [0] * 10)
+
+    def test_loads_end_level(self):
+        load = [0] * 10 + [15] * 10
+        final = np.array(load) + self.solve(load, n=200)
+        self.assertLessEqual(final.max() - final.min(), 1)
+
+    def test_quotas_cover_every_interview(self):
+        quotas = level_quotas(np.array([3.0, 0.0, 7.0]), 5)
+        self.assertEqual(quotas.tolist(), [1, 4, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()